@@ -190,11 +190,14 @@ BEGIN
     FROM tokens t
     WHERE t.token_id = p_token_id;
     
-    -- Return error if token not found
+    -- Return error if token not found, wrapped so callers can spot it
+    -- from the first bytes of the JSON text
     IF v_token IS NULL THEN
         RETURN jsonb_build_object(
-            'error', 'Token not found',
-            'status', 404
+            '__err__', jsonb_build_object(
+                'error', 'Token not found',
+                'status', 404
+            )
         );
     END IF;
     
@@ -233,6 +236,29 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Function to get holders for several tokens in one call
+CREATE OR REPLACE FUNCTION get_token_holders_batch(
+    p_token_ids VARCHAR[],
+    p_limits INTEGER[],
+    p_offsets INTEGER[]
+)
+RETURNS JSONB AS $$
+BEGIN
+    -- One result per requested token, in request order
+    RETURN COALESCE(
+        (
+            SELECT jsonb_agg(COALESCE(r.result->'__err__', r.result) ORDER BY r.ord)
+            FROM (
+                SELECT get_token_holders(q.token_id, q.lim, q.off) AS result, q.ord
+                FROM unnest(p_token_ids, p_limits, p_offsets)
+                    WITH ORDINALITY AS q(token_id, lim, off, ord)
+            ) r
+        ),
+        '[]'::JSONB
+    );
+END;
+$$ LANGUAGE plpgsql;
+
 -- Function to get top tokens by holder count
 CREATE OR REPLACE FUNCTION get_top_tokens(
     p_limit INTEGER DEFAULT 20,
@@ -1,6 +1,9 @@
 -- Create tables and indexes for the Ergo Explorer database
 -- This schema is based on the explorer-backend project's schema
 
+-- Trigram operator classes for the asset search indexes
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Core Tables for Ergo Explorer
 
 -- Blocks table
@@ -80,6 +83,8 @@ CREATE TABLE outputs (
 CREATE INDEX outputs_tx_id_idx ON outputs(tx_id);
 CREATE INDEX outputs_address_idx ON outputs(address);
 CREATE INDEX outputs_spent_by_tx_id_idx ON outputs(spent_by_tx_id);
+-- Covering index for address balances: unspent boxes only, index-only scans
+CREATE INDEX ix_outputs_utxo ON outputs(address) INCLUDE (box_id, value) WHERE spent_by_tx_id IS NULL;
 
 -- Assets table
 CREATE TABLE assets (
@@ -94,7 +99,8 @@ CREATE TABLE assets (
     CONSTRAINT assets_box_id_fk FOREIGN KEY (box_id) REFERENCES outputs(box_id)
 );
 
-CREATE INDEX assets_token_id_idx ON assets(token_id);
+-- Token lookups joined to their boxes, answered from the index alone
+CREATE INDEX assets_token_id_box_id_idx ON assets(token_id, box_id);
 CREATE INDEX assets_box_id_idx ON assets(box_id);
 
 -- Metadata Tables
@@ -111,6 +117,9 @@ CREATE TABLE token_info (
 );
 
 CREATE INDEX token_info_name_idx ON token_info(name);
+-- Asset search filters names and token IDs with ILIKE '%q%', which a btree cannot serve
+CREATE INDEX ix_token_info_id_trgm ON token_info USING gin (token_id gin_trgm_ops);
+CREATE INDEX ix_token_info_name_trgm ON token_info USING gin (name gin_trgm_ops);
 
 -- Sync Status table
 CREATE TABLE sync_status (
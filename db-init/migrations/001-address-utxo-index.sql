@@ -0,0 +1,20 @@
+-- Covering index for address balance lookups on an existing database
+--
+-- Fresh databases get this from init-schema.sql. Files in this directory are
+-- not run by the Postgres entrypoint, apply them by hand:
+--   psql "$DATABASE_URL" -f db-init/migrations/001-address-utxo-index.sql
+--
+-- CONCURRENTLY keeps the indexer writing while the index builds. It cannot
+-- run inside a transaction, so do not wrap this file in BEGIN/COMMIT.
+
+-- Only unspent boxes, carrying the columns the balance query reads so it is
+-- answered by an index-only scan
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_outputs_utxo
+    ON outputs (address) INCLUDE (box_id, value)
+    WHERE spent_by_tx_id IS NULL;
+
+-- Asset lookups by box, already present on databases built from init-schema.sql
+CREATE INDEX CONCURRENTLY IF NOT EXISTS assets_box_id_idx ON assets (box_id);
+
+-- Refresh the visibility map so index-only scans skip the heap
+VACUUM (ANALYZE) outputs;
@@ -0,0 +1,14 @@
+-- Trigram indexes for asset search on an existing database
+--
+-- Fresh databases get them from db-init/init-schema.sql. This file is for
+-- databases with the models' layout (token_info.id, asset_metadata.name).
+-- Apply by hand, outside a transaction because of CONCURRENTLY:
+--   psql "$DATABASE_URL" -f db-init/migrations/002-asset-search-trgm.sql
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Asset search filters with ILIKE '%q%', which a btree cannot serve
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_asset_metadata_name_trgm
+    ON asset_metadata USING gin (name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_token_info_id_trgm
+    ON token_info USING gin (id gin_trgm_ops);
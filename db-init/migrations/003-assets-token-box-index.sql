@@ -0,0 +1,17 @@
+-- Composite asset index for per-token queries on an existing database
+--
+-- Fresh databases get this from init-schema.sql. Apply by hand:
+--   psql "$DATABASE_URL" -f db-init/migrations/003-assets-token-box-index.sql
+--
+-- CONCURRENTLY cannot run inside a transaction, do not wrap this file in
+-- BEGIN/COMMIT.
+
+-- Supply, holder and activity lookups filter on token_id and join outputs on
+-- box_id, both served by this index without touching the assets heap
+CREATE INDEX CONCURRENTLY IF NOT EXISTS assets_token_id_box_id_idx
+    ON assets (token_id, box_id);
+
+-- Its leading column makes the single-column index redundant
+DROP INDEX CONCURRENTLY IF EXISTS assets_token_id_idx;
+
+ANALYZE assets;
@@ -0,0 +1,40 @@
+"""
+In-process response cache.
+"""
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Small dict-backed cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, ttl: float, max_size: int = 1024):
+        """Initialize cache."""
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for the cache TTL."""
+        now = time.monotonic()
+        if len(self._data) >= self.max_size:
+            # Drop expired entries first, then the oldest insertion
+            self._data = {k: v for k, v in self._data.items() if v[0] >= now}
+            if len(self._data) >= self.max_size:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
@@ -0,0 +1,124 @@
+"""
+Database connection pool for the token API.
+"""
+import asyncio
+import logging
+import os
+from typing import Any, AsyncGenerator, Dict, Optional
+
+import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
+from fastapi import FastAPI, HTTPException
+
+from metrics import db_query_timer
+
+logger = logging.getLogger(__name__)
+
+POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
+POSTGRES_PORT = int(os.getenv("POSTGRES_PORT", "5432"))
+POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
+POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "changeme")
+POSTGRES_DB = os.getenv("POSTGRES_DB", "ergo_explorer")
+
+# Point these at PgBouncer to multiplex many clients over few backends
+DB_POOL_HOST = os.getenv("DB_POOL_HOST", POSTGRES_HOST)
+DB_POOL_PORT = int(os.getenv("DB_POOL_PORT", str(POSTGRES_PORT)))
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "10"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "50"))
+# Must be 0 behind PgBouncer in transaction mode
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+DB_COMMAND_TIMEOUT = float(os.getenv("DB_COMMAND_TIMEOUT", "5"))
+DB_ACQUIRE_TIMEOUT = float(os.getenv("DB_ACQUIRE_TIMEOUT", "2.0"))
+
+# Stored procedure calls served by the token routes, returned as JSON text
+TOKEN_QUERIES = {
+    "get_token_holders": "SELECT get_token_holders($1, $2, $3)::text",
+    "get_token_holders_batch": "SELECT get_token_holders_batch($1, $2, $3)::text",
+    "get_top_tokens": "SELECT get_top_tokens($1, $2)::text",
+    "get_address_tokens": "SELECT get_address_tokens($1, $2, $3)::text",
+}
+
+pool: Optional[asyncpg.Pool] = None
+
+
+class TokenConnection(asyncpg.Connection):
+    """Connection that keeps the token stored procedure calls prepared."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize connection."""
+        super().__init__(*args, **kwargs)
+        self._token_statements: Dict[str, PreparedStatement] = {}
+
+    async def prepare_token_statements(self) -> None:
+        """Parse and plan every token query once for this connection."""
+        for name, query in TOKEN_QUERIES.items():
+            self._token_statements[name] = await self.prepare(query)
+
+    async def fetch_token_json(self, name: str, *args: Any) -> str:
+        """Run a token query, using the prepared statement when there is one."""
+        statement = self._token_statements.get(name)
+        with db_query_timer(name):
+            if statement is None:
+                return await self.fetchval(TOKEN_QUERIES[name], *args)
+            return await statement.fetchval(*args)
+
+
+async def _init_connection(conn: TokenConnection) -> None:
+    """Prepare a new connection so it is ready to serve."""
+    await conn.execute("SELECT 1")
+    # Prepared statements do not survive PgBouncer transaction pooling
+    if DB_STATEMENT_CACHE_SIZE > 0:
+        await conn.prepare_token_statements()
+
+
+async def init_db_pool() -> asyncpg.Pool:
+    """Create the connection pool and force min_size connections open."""
+    global pool
+    if pool is None:
+        pool = await asyncpg.create_pool(
+            host=DB_POOL_HOST,
+            port=DB_POOL_PORT,
+            user=POSTGRES_USER,
+            password=POSTGRES_PASSWORD,
+            database=POSTGRES_DB,
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            command_timeout=DB_COMMAND_TIMEOUT,
+            statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+            init=_init_connection,
+            connection_class=TokenConnection,
+        )
+        # Touch every idle connection so the first burst of traffic
+        # does not pay for connection setup
+        await asyncio.gather(
+            *[pool.execute("SELECT 1") for _ in range(pool.get_min_size())]
+        )
+        logger.info(f"Database pool warmed with {pool.get_min_size()} connections")
+    return pool
+
+
+async def close_db_pool() -> None:
+    """Close the connection pool."""
+    global pool
+    if pool is not None:
+        await pool.close()
+        pool = None
+
+
+async def get_db() -> AsyncGenerator[TokenConnection, None]:
+    """Acquire a pooled connection, bounding the wait for a free one."""
+    db_pool = pool or await init_db_pool()
+    try:
+        conn = await db_pool.acquire(timeout=DB_ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Database busy")
+    try:
+        yield conn
+    finally:
+        await db_pool.release(conn)
+
+
+def setup_database(app: FastAPI) -> None:
+    """Open and warm the pool on startup and close it on shutdown."""
+    app.add_event_handler("startup", init_db_pool)
+    app.add_event_handler("shutdown", close_db_pool)
@@ -30,6 +30,18 @@ class TokenHolderResponse(BaseModel):
     offset: int
 
 
+class TokenHoldersQuery(BaseModel):
+    """A single token holders lookup within a batch request."""
+    token_id: str
+    limit: int = Field(20, ge=1, le=100)
+    offset: int = Field(0, ge=0)
+
+
+class TokenHoldersBatchRequest(BaseModel):
+    """Request model for the batched token holders endpoint."""
+    tokens: List[TokenHoldersQuery] = Field(..., min_items=1, max_items=100)
+
+
 class TokenWithHolderCount(BaseModel):
     """Token model with holder count."""
     tokenId: str
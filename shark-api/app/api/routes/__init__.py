@@ -1,14 +1,8 @@
 from fastapi import APIRouter
-from .blocks import router as blocks_router
-from .transactions import router as transactions_router
-from .addresses import router as addresses_router
-from .info import router as info_router
 from .tokens import router as tokens_router
 
+# Block, transaction, address and status routes are served by
+# shark_api.api.v1; only the token routes live here.
 router = APIRouter()
 
-router.include_router(blocks_router)
-router.include_router(transactions_router)
-router.include_router(addresses_router)
-router.include_router(info_router)
-router.include_router(tokens_router) 
\ No newline at end of file
+router.include_router(tokens_router)
@@ -1,24 +1,58 @@
 """
 Token related API endpoints.
 """
-from fastapi import APIRouter, Query, HTTPException, Depends
+import os
+from contextlib import contextmanager
+from fastapi import APIRouter, Query, HTTPException, Depends, Response
 from typing import Optional, List, Dict, Any
 import asyncpg
+import orjson
+from ..cache import TTLCache
 from ..database import get_db
 from ..models.token import (
     TokenHolderResponse,
+    TokenHoldersBatchRequest,
     TopTokensResponse,
     AddressTokensResponse
 )
-from ..metrics import track_request, track_db_query
+from metrics import track_cache_hit, track_cache_miss
 
 router = APIRouter(
     prefix="/tokens",
     tags=["tokens"],
 )
 
+# Include exception text in error responses only when debugging
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 
-@router.get("/{token_id}/holders", response_model=TokenHolderResponse)
+# Serialized responses for the read-heavy token endpoints
+response_cache = TTLCache(ttl=15)
+
+
+@contextmanager
+def handle_errors():
+    """Turn database and unexpected errors into 500 responses."""
+    try:
+        yield
+    except HTTPException:
+        raise
+    except asyncpg.PostgresError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error: {str(e)}" if DEBUG else "Database error"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}" if DEBUG else "Internal server error"
+        )
+
+
+@router.get(
+    "/{token_id}/holders",
+    response_class=Response,
+    responses={200: {"model": TokenHolderResponse}}
+)
 async def get_token_holders(
     token_id: str,
     limit: int = Query(20, ge=1, le=100),
@@ -36,39 +70,70 @@ async def get_token_holders(
     Returns:
     - Token information and a list of holders with their balances
     """
-    with track_request("GET", f"/tokens/{token_id}/holders"):
-        try:
-            with track_db_query("get_token_holders"):
-                # Call the stored procedure to get token holders
-                result = await conn.fetchval(
-                    "SELECT get_token_holders($1, $2, $3)",
-                    token_id, limit, offset
+    cache_key = ("get_token_holders", token_id, limit, offset)
+    raw = response_cache.get(cache_key)
+    if raw is not None:
+        track_cache_hit("token_holders")
+        return Response(content=raw, media_type="application/json")
+    track_cache_miss("token_holders")
+    
+    with handle_errors():
+        # Call the stored procedure to get token holders as JSON text
+        raw = await conn.fetch_token_json(
+            "get_token_holders", token_id, limit, offset
+        )
+        
+        # Errors come back wrapped in a single "__err__" key
+        if raw.startswith('{"__err__"'):
+            result = orjson.loads(raw)['__err__']
+            if result.get('status') == 404:
+                raise HTTPException(status_code=404, detail="Token not found")
+            else:
+                raise HTTPException(
+                    status_code=result.get('status', 500),
+                    detail=result.get('error', "Unknown error")
                 )
-                
-                # Check if the result contains an error
-                if result and isinstance(result, dict) and 'error' in result:
-                    if result.get('status') == 404:
-                        raise HTTPException(status_code=404, detail="Token not found")
-                    else:
-                        raise HTTPException(
-                            status_code=result.get('status', 500),
-                            detail=result.get('error', "Unknown error")
-                        )
-                
-                return result
-        except asyncpg.PostgresError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Database error: {str(e)}"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Internal server error: {str(e)}"
-            )
+        
+        response_cache.set(cache_key, raw)
+        return Response(content=raw, media_type="application/json")
+
+
+@router.post(
+    "/holders:batch",
+    response_class=Response,
+    responses={200: {"model": List[TokenHolderResponse]}}
+)
+async def get_token_holders_batch(
+    request: TokenHoldersBatchRequest,
+    conn=Depends(get_db)
+):
+    """
+    Get token holders for several tokens in a single request.
+    
+    Parameters:
+    - tokens: Up to 100 lookups, each with token_id, limit and offset
+    
+    Returns:
+    - A list with one token holders result per lookup, in request order.
+      Unknown tokens are returned as an error object.
+    """
+    with handle_errors():
+        # One stored procedure call for every requested token
+        raw = await conn.fetch_token_json(
+            "get_token_holders_batch",
+            [query.token_id for query in request.tokens],
+            [query.limit for query in request.tokens],
+            [query.offset for query in request.tokens]
+        )
+        
+        return Response(content=raw, media_type="application/json")
 
 
-@router.get("/top", response_model=TopTokensResponse)
+@router.get(
+    "/top",
+    response_class=Response,
+    responses={200: {"model": TopTokensResponse}}
+)
 async def get_top_tokens(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
@@ -84,29 +149,28 @@ async def get_top_tokens(
     Returns:
     - List of tokens with their holder counts
     """
-    with track_request("GET", "/tokens/top"):
-        try:
-            with track_db_query("get_top_tokens"):
-                # Call the stored procedure to get top tokens
-                result = await conn.fetchval(
-                    "SELECT get_top_tokens($1, $2)",
-                    limit, offset
-                )
-                
-                return result
-        except asyncpg.PostgresError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Database error: {str(e)}"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Internal server error: {str(e)}"
-            )
+    cache_key = ("get_top_tokens", limit, offset)
+    raw = response_cache.get(cache_key)
+    if raw is not None:
+        track_cache_hit("top_tokens")
+        return Response(content=raw, media_type="application/json")
+    track_cache_miss("top_tokens")
+    
+    with handle_errors():
+        # Call the stored procedure to get top tokens as JSON text
+        raw = await conn.fetch_token_json(
+            "get_top_tokens", limit, offset
+        )
+        
+        response_cache.set(cache_key, raw)
+        return Response(content=raw, media_type="application/json")
 
 
-@router.get("/address/{address}", response_model=AddressTokensResponse)
+@router.get(
+    "/address/{address}",
+    response_class=Response,
+    responses={200: {"model": AddressTokensResponse}}
+)
 async def get_address_tokens(
     address: str,
     limit: int = Query(20, ge=1, le=100),
@@ -124,23 +188,10 @@ async def get_address_tokens(
     Returns:
     - List of tokens with balances
     """
-    with track_request("GET", f"/tokens/address/{address}"):
-        try:
-            with track_db_query("get_address_tokens"):
-                # Call the stored procedure to get address tokens
-                result = await conn.fetchval(
-                    "SELECT get_address_tokens($1, $2, $3)",
-                    address, limit, offset
-                )
-                
-                return result
-        except asyncpg.PostgresError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Database error: {str(e)}"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Internal server error: {str(e)}"
-            ) 
\ No newline at end of file
+    with handle_errors():
+        # Call the stored procedure to get address tokens as JSON text
+        raw = await conn.fetch_token_json(
+            "get_address_tokens", address, limit, offset
+        )
+        
+        return Response(content=raw, media_type="application/json") 
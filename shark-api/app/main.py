@@ -0,0 +1,23 @@
+"""
+Token API application.
+
+Serves the token routes on their own; run from the shark-api directory so
+the shared metrics module is importable:
+
+    uvicorn app.main:app
+"""
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from metrics import setup_metrics
+
+from .api.database import setup_database
+from .api.routes import router
+
+app = FastAPI(title="Shark Explorer Token API", default_response_class=ORJSONResponse)
+app.include_router(router, prefix="/api")
+
+# Opens and warms the token pool on startup, closes it on shutdown
+setup_database(app)
+# Counts and times every request, flushing counts to Prometheus in batches
+setup_metrics(app)
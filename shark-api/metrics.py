@@ -3,8 +3,11 @@ Metrics collectors for the API service.
 This module provides Prometheus metrics for monitoring API performance.
 """
 
+import asyncio
 import time
+from functools import lru_cache
 from prometheus_client import Counter, Gauge, Histogram, Summary
+from starlette.middleware.base import BaseHTTPMiddleware
 
 # Request metrics
 REQUEST_COUNT = Counter(
@@ -72,49 +75,139 @@ RATE_LIMIT_HIT_COUNT = Counter(
     ['client_ip']
 )
 
+# Labelled children, bound once per label set instead of on every call
+@lru_cache(maxsize=1024)
+def _request_latency_child(method, endpoint):
+    return REQUEST_LATENCY.labels(method=method, endpoint=endpoint)
+
+
+@lru_cache(maxsize=1024)
+def _db_query_count_child(query_type):
+    return DB_QUERY_COUNT.labels(query_type=query_type)
+
+
+@lru_cache(maxsize=1024)
+def _db_query_latency_child(query_type):
+    return DB_QUERY_LATENCY.labels(query_type=query_type)
+
+
 # Helper timing context managers
 class RequestLatencyTimer:
     """Context manager for timing API requests and reporting to Prometheus."""
+    __slots__ = ("method", "endpoint", "start")
+
     def __init__(self, method, endpoint):
         self.method = method
         self.endpoint = endpoint
         self.start = 0
 
     def __enter__(self):
-        self.start = time.time()
+        self.start = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        REQUEST_LATENCY.labels(
-            method=self.method,
-            endpoint=self.endpoint
-        ).observe(time.time() - self.start)
+        _request_latency_child(self.method, self.endpoint).observe(time.perf_counter() - self.start)
 
 
 class DatabaseQueryTimer:
     """Context manager for timing database queries and reporting to Prometheus."""
+    __slots__ = ("query_type", "start")
+
     def __init__(self, query_type):
         self.query_type = query_type
         self.start = 0
 
     def __enter__(self):
-        self.start = time.time()
-        DB_QUERY_COUNT.labels(query_type=self.query_type).inc()
+        self.start = time.perf_counter()
+        _db_query_count_child(self.query_type).inc()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        DB_QUERY_LATENCY.labels(
-            query_type=self.query_type
-        ).observe(time.time() - self.start)
+        _db_query_latency_child(self.query_type).observe(time.perf_counter() - self.start)
+
+
+class _FastCounter:
+    """Plain in-process counter, flushed into REQUEST_COUNT in batches."""
+    __slots__ = ("n",)
+
+    def __init__(self):
+        self.n = 0
+
+    def inc(self):
+        self.n += 1
+
+
+# Pending request counts keyed by (method, endpoint, status_code)
+_request_counts = {}
+
+# How often pending request counts are pushed to Prometheus, in seconds
+REQUEST_COUNT_FLUSH_INTERVAL = 0.5
 
 
 def track_request(method, endpoint, status_code):
     """Track an API request."""
-    REQUEST_COUNT.labels(
-        method=method,
-        endpoint=endpoint,
-        status_code=status_code
-    ).inc()
+    key = (method, endpoint, status_code)
+    counter = _request_counts.get(key)
+    if counter is None:
+        counter = _request_counts[key] = _FastCounter()
+    counter.inc()
+
+
+def flush_request_counts():
+    """Push accumulated request counts to REQUEST_COUNT."""
+    for (method, endpoint, status_code), counter in list(_request_counts.items()):
+        delta = counter.n
+        if delta:
+            counter.n = 0
+            REQUEST_COUNT.labels(
+                method=method,
+                endpoint=endpoint,
+                status_code=status_code
+            ).inc(delta)
+
+
+async def request_count_flusher(interval=REQUEST_COUNT_FLUSH_INTERVAL):
+    """Background task that periodically flushes request counts."""
+    while True:
+        await asyncio.sleep(interval)
+        flush_request_counts()
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Count and time every request, labelled by its route template."""
+
+    async def dispatch(self, request, call_next):
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            # The router records the matched route in the shared scope
+            route = request.scope.get("route")
+            endpoint = route.path if route is not None else "unmatched"
+            _request_latency_child(request.method, endpoint).observe(
+                time.perf_counter() - start
+            )
+            track_request(request.method, endpoint, str(status_code))
+
+
+def setup_metrics(app):
+    """Add the metrics middleware and start the request count flusher."""
+    app.add_middleware(MetricsMiddleware)
+    tasks = []
+
+    async def start_flusher():
+        tasks.append(asyncio.create_task(request_count_flusher()))
+
+    async def stop_flusher():
+        for task in tasks:
+            task.cancel()
+        flush_request_counts()
+
+    app.add_event_handler("startup", start_flusher)
+    app.add_event_handler("shutdown", stop_flusher)
 
 
 def track_error(method, endpoint, error_type):
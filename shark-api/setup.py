@@ -7,13 +7,17 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "fastapi>=0.95.0,<0.96.0",
-        "uvicorn>=0.22.0,<0.23.0",
+        # standard pulls in uvloop and httptools where the platform has them
+        "uvicorn[standard]>=0.22.0,<0.23.0",
         "pydantic>=1.10.0,<2.0.0",
         "sqlalchemy>=2.0.0,<3.0.0",
         "asyncpg>=0.27.0,<0.28.0",
         "prometheus-client>=0.17.0,<0.18.0",
         "psycopg>=3.1.8,<4.0.0",
         "aiohttp>=3.8.4,<3.9.0",
+        # 3.9 adds Fragment, used to pass stored JSON through unparsed
+        "orjson>=3.9.0",
+        "redis>=4.2.0",
         "structlog>=21.1.0",
         "python-dotenv>=0.19.0",
     ],
@@ -1,45 +1,51 @@
 """Address endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
+import asyncpg
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....db.dependencies import get_db
+from ....db.dependencies import get_db, get_pg_pool
 from ....db.repositories.addresses import AddressRepository
 from ....schemas.addresses import AddressBalance, AddressStats, AddressDetail
+from ....schemas.base import dump_model
 
 router = APIRouter()
 
 @router.get("/{address}/balance", response_model=AddressBalance)
 async def get_address_balance(
     address: str,
-    db: AsyncSession = Depends(get_db)
-) -> AddressBalance:
+    db: AsyncSession = Depends(get_db),
+    pool: asyncpg.Pool = Depends(get_pg_pool)
+) -> Response:
     """Get address balance."""
-    repo = AddressRepository(db)
-    balance = await repo.get_address_balance(address)
+    repo = AddressRepository(db, pool)
+    balance = await repo.get_address_balance_fast(address)
     if not balance:
         raise HTTPException(status_code=404, detail="Address not found")
-    return AddressBalance.from_orm(balance)
+    # Built from trusted rows; encode once with orjson rather than having
+    # FastAPI re-validate it against response_model and walk it again
+    return Response(content=dump_model(balance), media_type="application/json")
 
 @router.get("/{address}/stats", response_model=AddressStats)
 async def get_address_stats(
     address: str,
     db: AsyncSession = Depends(get_db)
-) -> AddressStats:
+) -> Response:
     """Get address statistics."""
     repo = AddressRepository(db)
     stats = await repo.get_address_stats(address)
     if not stats:
         raise HTTPException(status_code=404, detail="Address not found")
-    return AddressStats.from_orm(stats)
+    return Response(content=dump_model(AddressStats.from_orm(stats)), media_type="application/json")
 
 @router.get("/{address}", response_model=AddressDetail)
 async def get_address_details(
     address: str,
-    db: AsyncSession = Depends(get_db)
-) -> AddressDetail:
+    db: AsyncSession = Depends(get_db),
+    pool: asyncpg.Pool = Depends(get_pg_pool)
+) -> Response:
     """Get address details."""
-    repo = AddressRepository(db)
+    repo = AddressRepository(db, pool)
     details = await repo.get_address_details(address)
     if not details:
         raise HTTPException(status_code=404, detail="Address not found")
-    return AddressDetail.from_orm(details) 
\ No newline at end of file
+    return Response(content=dump_model(details), media_type="application/json")
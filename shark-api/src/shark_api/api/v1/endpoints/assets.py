@@ -1,11 +1,15 @@
 """Asset endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, Query
+import base64
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ....core.cache import cached_by_height
 from ....db.dependencies import get_db
 from ....db.repositories.assets import AssetRepository
-from ....schemas.assets import AssetDetail, AssetSummary
-from ....schemas.base import PaginatedResponse
+from ....schemas.assets import AssetDetail, AssetList
+from ....schemas.base import dump_model
 
 router = APIRouter()
 
@@ -13,35 +17,73 @@ router = APIRouter()
 async def get_asset_details(
     token_id: str,
     db: AsyncSession = Depends(get_db)
-) -> AssetDetail:
+) -> Response:
     """Get asset details."""
     repo = AssetRepository(db)
     asset = await repo.get_asset_details(token_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return AssetDetail.from_orm(asset)
+    return Response(content=dump_model(asset), media_type="application/json")
+
+def encode_cursor(key: Tuple[str, str]) -> str:
+    """Encode a keyset position as an opaque cursor."""
+    name, token_id = key
+    # Token IDs are hex, so the first colon always ends the ID
+    return base64.urlsafe_b64encode(f"{token_id}:{name}".encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        token_id, name = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        return name, token_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-@router.get("", response_model=PaginatedResponse[AssetSummary])
+@router.get("", response_model=AssetList)
 async def search_assets(
+    request: Request,
     query: str = Query("", min_length=0),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    offset: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(10, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
-) -> PaginatedResponse[AssetSummary]:
-    """Search assets."""
-    repo = AssetRepository(db)
+) -> Response:
+    """
+    Search assets.
     
-    # Search assets
-    assets = await repo.search_assets(
-        query=query,
-        skip=offset,
-        limit=limit
-    )
-    total = await repo.count_search_results(query)
+    Follow next_cursor to page through results; the cost of a cursor page
+    does not grow with depth. The total is only reported for offset pages.
+    """
+    async def load_page() -> AssetList:
+        repo = AssetRepository(db)
+        
+        if cursor is not None:
+            items, next_key = await repo.search_assets_after(
+                query=query,
+                after=decode_cursor(cursor),
+                limit=limit
+            )
+            total = None
+        else:
+            # Search assets, the total count comes back with the page
+            items, total, next_key = await repo.search_assets_with_total(
+                query=query,
+                skip=offset,
+                limit=limit
+            )
+        
+        # Summaries are validated by the repository, skip a second pass
+        return AssetList.construct(
+            items=items,
+            total=total,
+            page=offset // limit + 1,
+            page_size=limit,
+            next_cursor=encode_cursor(next_key) if next_key else None
+        )
     
-    return PaginatedResponse(
-        items=[AssetSummary.from_orm(asset) for asset in assets],
-        total=total,
-        offset=offset,
-        limit=limit
-    ) 
\ No newline at end of file
+    return await cached_by_height(
+        request,
+        "assets.search",
+        {"query": query, "cursor": cursor, "offset": offset, "limit": limit},
+        load_page
+    )
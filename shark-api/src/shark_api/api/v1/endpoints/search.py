@@ -1,7 +1,8 @@
 """Search endpoints."""
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ....core.cache import cached_by_height
 from ....db.dependencies import get_db
 from ....db.repositories.search import SearchRepository
 from ....schemas.search import SearchResult
@@ -10,11 +11,14 @@ router = APIRouter()
 
 @router.get("", response_model=SearchResult)
 async def search(
+    request: Request,
     query: str = Query(..., min_length=1),
     limit: int = Query(10, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
-) -> SearchResult:
+) -> Response:
     """Search blocks, transactions, addresses, and assets."""
-    repo = SearchRepository(db)
-    result = await repo.search(query=query, limit=limit)
-    return SearchResult.from_orm(result) 
\ No newline at end of file
+    async def load_result() -> SearchResult:
+        repo = SearchRepository(db)
+        return await repo.search(query=query, limit=limit)
+    
+    return await cached_by_height(request, "search", {"query": query, "limit": limit}, load_result)
\ No newline at end of file
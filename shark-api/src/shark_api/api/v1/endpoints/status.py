@@ -1,26 +1,43 @@
 """Status endpoints."""
-from fastapi import APIRouter, Depends
+import aiohttp
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ....db.dependencies import get_db
 from ....db.repositories.blocks import BlockRepository
 from ....schemas.status import SystemStatus, NodeStatus, IndexerStatus
-from ....core.node import get_node_status
+from ....core.cache import cached_json
+from ....core.ttl import TTLValue
+from ....core.node import get_http_session, get_node_status
 from ....core.config import settings
-from ....core.simple_monitoring import indexer_height as indexer_height_gauge
-from ....core.simple_monitoring import node_height as node_height_gauge
-from ....core.simple_monitoring import sync_percentage as sync_percentage_gauge
 
 router = APIRouter()
 
+# Status only changes once per block, so serve it from cache briefly
+STATUS_CACHE_TTL = 5
+# The Redis copy means one worker per STATUS_CACHE_TTL asks the node and
+# database; this per-worker copy means pollers, which hit the endpoint
+# constantly, cost at most one Redis round trip per worker per second
+STATUS_LOCAL_TTL = 1.0
+
+_status_body: TTLValue[bytes] = TTLValue(STATUS_LOCAL_TTL)
+
 @router.get("", response_model=SystemStatus)
 async def get_system_status(
-    db: AsyncSession = Depends(get_db)
-) -> SystemStatus:
+    db: AsyncSession = Depends(get_db),
+    http: aiohttp.ClientSession = Depends(get_http_session)
+) -> Response:
     """Get system status."""
+    body = await _status_body.get(
+        lambda: cached_json("status:v1", STATUS_CACHE_TTL, lambda: build_system_status(db, http))
+    )
+    return Response(content=body, media_type="application/json")
+
+async def build_system_status(db: AsyncSession, http: aiohttp.ClientSession) -> SystemStatus:
+    """Build system status from the node and the indexed chain."""
     # Get node status
-    node_status = await get_node_status()
+    node_status = await get_node_status(http)
     
     # Get indexer status
     repo = BlockRepository(db)
@@ -30,11 +47,6 @@ async def get_system_status(
     # Calculate sync percentage
     sync_percentage = (indexer_height / node_status.block_height * 100) if node_status.block_height > 0 else 0
     
-    # Update metrics for monitoring
-    node_height_gauge.set(node_status.block_height)
-    indexer_height_gauge.set(indexer_height)
-    sync_percentage_gauge.set(sync_percentage)
-    
     return SystemStatus(
         node=NodeStatus(
             version=settings.VERSION,
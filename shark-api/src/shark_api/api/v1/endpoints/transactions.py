@@ -1,47 +1,98 @@
 """Transaction endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, Query
+import base64
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ....core.cache import cached_by_height, cached_json
 from ....db.dependencies import get_db
-from ....db.repositories.transactions import TransactionRepository
-from ....schemas.transactions import TransactionDetail, AddressTransaction
-from ....schemas.base import PaginatedResponse
+from ....db.repositories.transactions import ADDRESS_COUNT_CAP, TransactionRepository
+from ....schemas.transactions import TransactionDetail, AddressTransactionList
 
 router = APIRouter()
 
+# Transactions do not change once included, but confirmations grow every
+# block, so keep them for roughly one block interval
+TRANSACTION_CACHE_TTL = 120
+
 @router.get("/{tx_id}", response_model=TransactionDetail)
 async def get_transaction(
     tx_id: str,
     db: AsyncSession = Depends(get_db)
-) -> TransactionDetail:
+) -> Response:
     """Get transaction by ID."""
-    repo = TransactionRepository(db)
-    tx = await repo.get_transaction_with_details(tx_id)
-    if not tx:
-        raise HTTPException(status_code=404, detail="Transaction not found")
-    return TransactionDetail.from_orm(tx)
+    async def load_transaction() -> TransactionDetail:
+        repo = TransactionRepository(db)
+        tx = await repo.get_transaction_with_details(tx_id)
+        if not tx:
+            raise HTTPException(status_code=404, detail="Transaction not found")
+        return tx
+    
+    body = await cached_json(f"tx:{tx_id}", TRANSACTION_CACHE_TTL, load_transaction)
+    return Response(content=body, media_type="application/json")
+
+def encode_cursor(key: Tuple[int, int, str]) -> str:
+    """Encode a keyset position as an opaque cursor."""
+    height, tx_index, box_id = key
+    return base64.urlsafe_b64encode(f"{height}:{tx_index}:{box_id}".encode()).decode()
 
-@router.get("/address/{address}", response_model=PaginatedResponse[AddressTransaction])
+def decode_cursor(cursor: str) -> Tuple[int, int, str]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        height, tx_index, box_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return int(height), int(tx_index), box_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@router.get("/address/{address}", response_model=AddressTransactionList)
 async def get_address_transactions(
+    request: Request,
     address: str,
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    offset: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(10, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
-) -> PaginatedResponse[AddressTransaction]:
-    """Get transactions for address."""
-    repo = TransactionRepository(db)
+) -> Response:
+    """
+    Get transactions for address.
     
-    # Get transactions
-    transactions = await repo.get_address_transactions(
-        address=address,
-        skip=offset,
-        limit=limit
-    )
-    total = await repo.count_address_transactions(address)
+    Follow next_cursor to page through results; the cost of a cursor page
+    does not grow with depth. The total is only reported for offset pages
+    and stops at ADDRESS_COUNT_CAP + 1, flagged by total_capped.
+    """
+    async def load_page() -> AddressTransactionList:
+        repo = TransactionRepository(db)
+        
+        if cursor is not None:
+            transactions, next_key = await repo.get_address_transactions_after(
+                address=address,
+                after=decode_cursor(cursor),
+                limit=limit
+            )
+            total = None
+        else:
+            # Get the page and the total count in one round trip
+            transactions, total, next_key = await repo.get_address_transactions_with_total(
+                address=address,
+                skip=offset,
+                limit=limit
+            )
+        
+        # Items are built from trusted rows by the repository, skip validation
+        # here and in FastAPI's response_model check
+        return AddressTransactionList.construct(
+            items=transactions,
+            total=total,
+            total_capped=total is not None and total > ADDRESS_COUNT_CAP,
+            page=offset // limit + 1,
+            page_size=limit,
+            next_cursor=encode_cursor(next_key) if next_key else None
+        )
     
-    return PaginatedResponse(
-        items=[AddressTransaction.from_orm(tx) for tx in transactions],
-        total=total,
-        offset=offset,
-        limit=limit
-    ) 
\ No newline at end of file
+    return await cached_by_height(
+        request,
+        "transactions.address",
+        {"address": address, "cursor": cursor, "offset": offset, "limit": limit},
+        load_page
+    )
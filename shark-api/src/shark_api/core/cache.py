@@ -0,0 +1,182 @@
+"""Redis-backed response and token metadata caches."""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+import orjson
+import redis.asyncio as redis
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from prometheus_client import Counter
+
+from .config import settings
+from .monitoring import registry
+from ..db.database import indexed_height
+from ..schemas.base import dump_model
+
+logger = logging.getLogger(__name__)
+
+# Shared Redis client, connections are opened lazily from its pool
+redis_client = redis.from_url(settings.REDIS_URL)
+
+# How long a stale value may still be served while one worker recomputes it
+STALE_TTL_FACTOR = 6
+RECOMPUTE_LOCK_TTL = 3
+
+async def cached_json(
+    key: str,
+    ttl: int,
+    compute: Callable[[], Awaitable[BaseModel]]
+) -> bytes:
+    """
+    Get a JSON response body from the cache, computing it on a miss.
+
+    Values stay fresh for ttl seconds and are then served stale while a
+    single caller, holding a short NX lock, recomputes them.
+
+    Args:
+        key: Cache key
+        ttl: Seconds a cached value is considered fresh
+        compute: Coroutine function producing the response model
+
+    Returns:
+        JSON encoded response body
+    """
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            cached, fresh = await pipe.get(key).exists(f"{key}:fresh").execute()
+        if cached is not None:
+            if fresh:
+                return cached
+            # Stale: only the lock holder recomputes, everyone else gets the old value
+            if not await redis_client.set(f"{key}:lock", 1, nx=True, ex=RECOMPUTE_LOCK_TTL):
+                return cached
+    except redis.RedisError as e:
+        logger.warning(f"Cache unavailable for {key}: {str(e)}")
+        return dump_model(await compute())
+
+    body = dump_model(await compute())
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            await (
+                pipe.set(key, body, ex=ttl * STALE_TTL_FACTOR)
+                .set(f"{key}:fresh", 1, ex=ttl)
+                .delete(f"{key}:lock")
+                .execute()
+            )
+    except redis.RedisError as e:
+        logger.warning(f"Failed to cache {key}: {str(e)}")
+    return body
+
+# List pages only change when a block is indexed, ~2 minutes on Ergo
+LIST_CACHE_TTL = 120
+
+list_cache_requests_total = Counter(
+    "list_cache_requests_total",
+    "List endpoint cache lookups by endpoint and result",
+    ["endpoint", "result"],
+    registry=registry
+)
+
+async def cached_by_height(
+    request: Request,
+    endpoint: str,
+    params: Mapping[str, Any],
+    compute: Callable[[], Awaitable[BaseModel]],
+    ttl: int = LIST_CACHE_TTL
+) -> Response:
+    """
+    Get a list response cached until the next indexed block.
+
+    The key includes the latest indexed height, so a new block moves every
+    list to fresh keys and the old ones simply expire. The same key is sent
+    as a weak ETag, and a matching If-None-Match is answered with 304 before
+    Redis or the database are touched.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        endpoint: Name of the endpoint, used in the key and the hit counter
+        params: Request parameters that select the page
+        compute: Coroutine function producing the response model
+        ttl: Upper bound on how long a page is served
+
+    Returns:
+        JSON response, or 304 Not Modified
+    """
+    height = await indexed_height.get()
+    digest = hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=16).hexdigest()
+    # Clients may cache, but must revalidate since a block can land any time
+    headers = {"ETag": f'W/"{height}-{digest}"', "Cache-Control": "public, no-cache"}
+
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        list_cache_requests_total.labels(endpoint, "not_modified").inc()
+        return Response(status_code=304, headers=headers)
+
+    computed = False
+    async def compute_and_flag() -> BaseModel:
+        nonlocal computed
+        computed = True
+        return await compute()
+
+    body = await cached_json(f"list:{endpoint}:{height}:{digest}", ttl, compute_and_flag)
+    list_cache_requests_total.labels(endpoint, "miss" if computed else "hit").inc()
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Token metadata is fixed at mint, so it can be kept for a long time
+TOKEN_CACHE_TTL = 3600
+TOKEN_CACHE_LOCAL_SIZE = 10_000
+
+class TokenInfoCache:
+    """
+    Two-tier cache of token metadata.
+
+    Lookups go to a per-process LRU first and then to Redis, which is shared
+    by all workers. Both tiers expire entries after TOKEN_CACHE_TTL.
+    """
+
+    def __init__(self, ttl: int = TOKEN_CACHE_TTL, max_size: int = TOKEN_CACHE_LOCAL_SIZE):
+        """Initialize cache."""
+        self.ttl = ttl
+        self.max_size = max_size
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """Get cached metadata for a token, or None on a miss in both tiers."""
+        entry = self._local.get(token_id)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= time.monotonic():
+                self._local.move_to_end(token_id)
+                return value
+            del self._local[token_id]
+
+        try:
+            cached = await redis_client.get(f"tok:{token_id}")
+        except redis.RedisError as e:
+            logger.warning(f"Cache unavailable for token {token_id}: {str(e)}")
+            return None
+        if cached is None:
+            return None
+        value = orjson.loads(cached)
+        self._remember(token_id, value)
+        return value
+
+    async def set(self, token_id: str, value: Dict[str, Any]) -> None:
+        """Store token metadata in both tiers."""
+        self._remember(token_id, value)
+        try:
+            await redis_client.set(f"tok:{token_id}", orjson.dumps(value), ex=self.ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to cache token {token_id}: {str(e)}")
+
+    def _remember(self, token_id: str, value: Dict[str, Any]) -> None:
+        """Store in the process-local tier, evicting the least recently used entry."""
+        self._local[token_id] = (time.monotonic() + self.ttl, value)
+        self._local.move_to_end(token_id)
+        if len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+token_info_cache = TokenInfoCache()
@@ -1,5 +1,6 @@
 """API service configuration."""
 import os
+from functools import cached_property
 from typing import Optional, List
 from pydantic import PostgresDsn, BaseSettings
 
@@ -23,16 +24,56 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "changeme")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "ergo_explorer")
     
+    # Connection Pool Settings
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # Compiled statement cache entries per engine, SQLAlchemy's default is 500
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+    # Prepared statements kept per connection by asyncpg, its default is 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(
+        os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "1024")
+    )
+    # Set when POSTGRES_HOST/PORT point at PgBouncer in transaction mode:
+    # PgBouncer does the pooling, so the engine opens a connection per
+    # checkout, and neither the engine nor the raw asyncpg pools cache
+    # prepared statements
+    DB_USE_PGBOUNCER: bool = os.getenv("DB_USE_PGBOUNCER", "false").lower() in ("1", "true", "yes")
+    
+    # Raw asyncpg pool for read-only aggregate queries that bypass the ORM
+    ASYNCPG_POOL_MIN_SIZE: int = int(os.getenv("ASYNCPG_POOL_MIN_SIZE", "5"))
+    ASYNCPG_POOL_MAX_SIZE: int = int(os.getenv("ASYNCPG_POOL_MAX_SIZE", "20"))
+    ASYNCPG_POOL_MAX_INACTIVE_LIFETIME: float = float(
+        os.getenv("ASYNCPG_POOL_MAX_INACTIVE_LIFETIME", "300")
+    )
+    
     # Node Settings
     NODE_URL: str = os.getenv("NODE_URL", "http://192.168.1.195:9053")
     NETWORK: str = os.getenv("NETWORK", "mainnet")
     
+    # Redis Settings
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     
-    @property
+    @cached_property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
         """Get database URI."""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+    
+    @cached_property
+    def POSTGRES_DSN(self) -> str:
+        """Get plain PostgreSQL DSN for direct driver connections."""
+        return (
+            f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
+    
+    class Config:
+        # Settings are read once at import and never change afterwards
+        allow_mutation = False
+        keep_untouched = (cached_property,)
 
 settings = Settings() 
\ No newline at end of file
@@ -1,42 +1,68 @@
 """API middleware."""
+import logging
 import time
 from typing import Callable
 from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
+import redis.asyncio as redis
+from ..core.cache import redis_client
 from ..core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Increment the window counter and set its expiry in a single round trip
+FIXED_WINDOW_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
 class RateLimiter:
     """Rate limiting middleware."""
 
     def __init__(self):
         """Initialize rate limiter."""
-        self.requests = {}
         self.window = 60  # 1 minute window
+        self._incr_window = redis_client.register_script(FIXED_WINDOW_SCRIPT)
 
-    def is_rate_limited(self, client_id: str) -> bool:
+    async def is_rate_limited(self, client_id: str) -> bool:
         """Check if client is rate limited."""
-        now = time.time()
-        client_requests = self.requests.get(client_id, [])
-        
-        # Remove old requests
-        client_requests = [ts for ts in client_requests if now - ts < self.window]
-        
-        # Check rate limit
-        if len(client_requests) >= settings.RATE_LIMIT_PER_MINUTE:
-            return True
-            
-        # Add new request
-        client_requests.append(now)
-        self.requests[client_id] = client_requests
-        return False
+        window_start = int(time.time() // self.window)
+        key = f"rl:{client_id}:{window_start}"
+        try:
+            count = await self._incr_window(keys=[key], args=[self.window])
+        except redis.RedisError as e:
+            # Fail open rather than reject traffic when Redis is unavailable
+            logger.warning(f"Rate limiter unavailable: {str(e)}")
+            return False
+        return count > settings.RATE_LIMIT_PER_MINUTE
 
 rate_limiter = RateLimiter()
 
+# Responses smaller than this are not worth the compression overhead
+GZIP_MINIMUM_SIZE = 1024
+GZIP_LEVEL = 5
+# Paths that negotiate their own Content-Encoding
+SELF_COMPRESSED_PATHS = frozenset(("/metrics",))
+
+class CompressionMiddleware(GZipMiddleware):
+    """Gzip JSON responses for clients that accept it."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in SELF_COMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 async def rate_limit_middleware(request: Request, call_next: Callable) -> Response:
     """Rate limiting middleware."""
     client_id = request.client.host
     
-    if rate_limiter.is_rate_limited(client_id):
+    if await rate_limiter.is_rate_limited(client_id):
         return JSONResponse(
             status_code=429,
             content={
@@ -53,4 +79,7 @@ async def rate_limit_middleware(request: Request, call_next: Callable) -> Respon
 
 def add_middleware(app: FastAPI) -> None:
     """Add middleware to FastAPI application."""
-    app.middleware("http")(rate_limit_middleware) 
\ No newline at end of file
+    app.middleware("http")(rate_limit_middleware)
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_LEVEL
+    )
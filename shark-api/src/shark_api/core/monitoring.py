@@ -1,22 +1,24 @@
 """Metrics and monitoring."""
-import logging
 import asyncio
+import gzip
+import logging
 import time
 import os
-import random
-from typing import Optional, Dict, Any, Callable, AsyncGenerator
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
 import aiohttp
-from prometheus_client import Counter, Gauge, Info, Histogram, REGISTRY, CollectorRegistry, generate_latest
+import asyncpg
+from prometheus_client import (
+    Counter, Gauge, Histogram, CollectorRegistry, generate_latest, multiprocess
+)
+from prometheus_client.core import GaugeMetricFamily, InfoMetricFamily, Metric
 from fastapi import APIRouter, FastAPI, Request, Response
 from starlette.responses import PlainTextResponse
-from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
-from ..api.node import Node
-from ..db.repositories.blocks import BlockRepository
-from ..db.repositories.transactions import TransactionRepository
-from ..db.dependencies import get_db_session
 from ..core.config import settings
+from ..core.node import node_info_cache
+from ..core.ttl import TTLValue
+from ..db.repositories.transactions import TX_COUNT_ESTIMATE_QUERY
 
 # Initialize structured logger
 logger = structlog.get_logger("metrics_updater")
@@ -24,9 +26,6 @@ logger = structlog.get_logger("metrics_updater")
 # Create registry
 registry = CollectorRegistry()
 
-# Create router
-router = APIRouter()
-
 # Define metrics
 http_requests_total = Counter(
     "http_requests_total",
@@ -45,7 +44,8 @@ http_request_duration_seconds = Histogram(
 active_requests = Gauge(
     "active_requests",
     "Number of active requests",
-    registry=registry
+    registry=registry,
+    multiprocess_mode="livesum"
 )
 
 db_query_duration_seconds = Histogram(
@@ -55,187 +55,223 @@ db_query_duration_seconds = Histogram(
     registry=registry
 )
 
-indexer_height = Gauge(
-    "indexer_height",
-    "Current height of the indexer",
-    registry=registry
-)
+# Node and indexer figures are gathered at scrape time, see NodeDbCollector
+COLLECT_CACHE_SECONDS = float(os.getenv("METRICS_COLLECT_CACHE_SECONDS", "2"))
 
-node_height = Gauge(
-    "node_height",
-    "Current height of the Ergo node",
-    registry=registry
+# Both indexer figures in a single round trip
+DB_STATS_QUERY = (
+    f"SELECT ({TX_COUNT_ESTIMATE_QUERY}) AS tx_count, "
+    "(SELECT MAX(height) FROM blocks) AS height"
 )
 
-sync_percentage = Gauge(
-    "sync_percentage",
-    "Sync percentage of the indexer",
-    registry=registry
-)
+class NodeDbCollector:
+    """
+    Collects node and indexer metrics when Prometheus scrapes.
 
-total_transactions = Gauge(
-    "total_transactions",
-    "Total number of indexed transactions",
-    registry=registry
-)
+    The /metrics handler awaits refresh() before rendering, collect() then
+    yields the snapshot. Results are memoised for COLLECT_CACHE_SECONDS so
+    that several scrapers hitting /metrics at once share a single node call
+    and database round trip.
+    """
+    
+    def __init__(self, node_url: str, network: str):
+        """Initialize collector."""
+        self.node_url = node_url
+        self.network = network
+        self._snapshot: TTLValue[List[Metric]] = TTLValue(COLLECT_CACHE_SECONDS)
+        self._last_ts = 0.0
+        self._last_indexer_height = 0
+        self._last_node_height = 0
+        self._sync_metric: Optional[Metric] = None
+    
+    async def _fetch_node_info(self, http: aiohttp.ClientSession) -> Dict[str, Any]:
+        """Get node info, or an empty dict if the node is unreachable."""
+        try:
+            # Shared with the status endpoint, so a scrape right after a
+            # status request costs no extra node call
+            return await node_info_cache.get(http)
+        except Exception as e:
+            logger.error("Error getting node info", error=str(e))
+            return {}
+    
+    async def _fetch_db_stats(self, pool: asyncpg.Pool) -> Optional[Tuple[int, int]]:
+        """Get the transaction count and indexer height from the database."""
+        try:
+            # Planner estimate, a catalog lookup instead of a full table scan
+            tx_count, current_indexer_height = await pool.fetchrow(DB_STATS_QUERY)
+        except Exception as e:
+            # Logged once per refresh without a traceback, so a node or
+            # database outage does not turn scrapes into stack formatting
+            logger.error("Error collecting metrics from database", error=str(e))
+            return None
+        
+        # reltuples is -1 until the table is first analyzed
+        return max(tx_count or 0, 0), current_indexer_height or 0
+    
+    async def _build(self, http: aiohttp.ClientSession, pool: asyncpg.Pool) -> List[Metric]:
+        """Query the node and database and build fresh metric families."""
+        metrics: List[Metric] = []
+        now = time.monotonic()
+        elapsed = now - self._last_ts if self._last_ts else 0.0
+        self._last_ts = now
+        
+        # The node call and the database query are independent, run them together
+        data, db_stats = await asyncio.gather(
+            self._fetch_node_info(http),
+            self._fetch_db_stats(pool)
+        )
+        
+        current_node_height = data.get("fullHeight", 0) or 0
+        if data:
+            info = InfoMetricFamily("node_info", "Information about the connected Ergo node")
+            info.add_metric([], {
+                "network": self.network,
+                "version": str(data.get("appVersion", "unknown")),
+                "address": self.node_url
+            })
+            metrics.append(info)
+            metrics.append(GaugeMetricFamily(
+                "node_height", "Current height of the Ergo node", value=current_node_height
+            ))
+        
+        if db_stats is None:
+            return metrics
+        tx_count, current_indexer_height = db_stats
+        
+        metrics.append(GaugeMetricFamily(
+            "total_transactions", "Total number of indexed transactions", value=tx_count
+        ))
+        
+        if current_indexer_height > 0:
+            metrics.append(GaugeMetricFamily(
+                "indexer_height", "Current height of the indexer", value=current_indexer_height
+            ))
+            if current_node_height > 0:
+                # Fully synced and no new block means the same family as last time
+                if (
+                    self._sync_metric is None
+                    or current_indexer_height != self._last_indexer_height
+                    or current_node_height != self._last_node_height
+                ):
+                    self._sync_metric = GaugeMetricFamily(
+                        "sync_percentage",
+                        "Sync percentage of the indexer",
+                        value=(current_indexer_height / current_node_height) * 100
+                    )
+                metrics.append(self._sync_metric)
+            # Rate between this collection and the previous one
+            if self._last_indexer_height > 0 and elapsed > 0:
+                metrics.append(GaugeMetricFamily(
+                    "indexing_rate",
+                    "Rate of blocks indexed per second",
+                    value=(current_indexer_height - self._last_indexer_height) / elapsed
+                ))
+            self._last_indexer_height = current_indexer_height
+            self._last_node_height = current_node_height
+        
+        return metrics
+    
+    async def refresh(self, http: aiohttp.ClientSession, pool: asyncpg.Pool) -> None:
+        """Rebuild the snapshot unless it is younger than COLLECT_CACHE_SECONDS."""
+        await self._snapshot.get(lambda: self._build(http, pool))
+    
+    def collect(self) -> Iterator[Metric]:
+        """Yield the node and indexer metrics from the last refresh."""
+        yield from self._snapshot.value or []
 
-indexing_rate = Gauge(
-    "indexing_rate",
-    "Rate of blocks indexed per second",
-    registry=registry
-)
+node_db_collector = NodeDbCollector(settings.NODE_URL, settings.NETWORK)
 
-node_info = Info(
-    "node_info",
-    "Information about the connected Ergo node",
-    registry=registry
-)
+# Under `uvicorn --workers N` each worker writes its samples to
+# PROMETHEUS_MULTIPROC_DIR and the scrape aggregates them across workers
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    exposition_registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(exposition_registry)
+else:
+    exposition_registry = registry
+exposition_registry.register(node_db_collector)
+
+# Paths that are scraped or probed constantly and are not worth measuring
+UNMONITORED_PATHS = frozenset(("/metrics", "/health", "/ready"))
+
+# Labelled children, bounded by routes x methods x statuses
+_request_counters: Dict[Tuple[str, str, int], Any] = {}
+_request_histograms: Dict[Tuple[str, str], Any] = {}
 
-REFRESH_INTERVAL = int(os.getenv("METRICS_REFRESH_INTERVAL_SECONDS", "5"))
+def _request_counter(method: str, path: str, status: int):
+    """Get the cached request counter child for a label set."""
+    key = (method, path, status)
+    child = _request_counters.get(key)
+    if child is None:
+        child = _request_counters[key] = http_requests_total.labels(method, path, status)
+    return child
+
+def _request_histogram(method: str, path: str):
+    """Get the cached request duration child for a label set."""
+    key = (method, path)
+    child = _request_histograms.get(key)
+    if child is None:
+        child = _request_histograms[key] = http_request_duration_seconds.labels(method, path)
+    return child
+
+def route_label(request: Request) -> str:
+    """Label a request by its route template, bucketing unmatched paths."""
+    route = request.scope.get("route")
+    return route.path if route is not None else "other"
 
 async def monitoring_middleware(request: Request, call_next: Callable) -> Response:
     """Monitor request duration and count."""
+    if request.url.path in UNMONITORED_PATHS:
+        return await call_next(request)
+    
     active_requests.inc()
-    start_time = time.time()
+    # Monotonic, so clock adjustments never produce negative durations
+    start_time = time.perf_counter()
     
     try:
         response = await call_next(request)
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
+        path = route_label(request)
         
-        http_requests_total.labels(
-            method=request.method,
-            path=request.url.path,
-            status=response.status_code
-        ).inc()
-        
-        http_request_duration_seconds.labels(
-            method=request.method,
-            path=request.url.path
-        ).observe(duration)
+        _request_counter(request.method, path, response.status_code).inc()
+        _request_histogram(request.method, path).observe(duration)
         
         return response
     except Exception as e:
-        http_requests_total.labels(
-            method=request.method,
-            path=request.url.path,
-            status=500
-        ).inc()
+        _request_counter(request.method, route_label(request), 500).inc()
         raise e
     finally:
         active_requests.dec()
 
-@router.get("/metrics")
-async def metrics_endpoint(request: Request) -> Response:
-    """Expose Prometheus metrics."""
-    metrics = generate_latest(registry)
-    return PlainTextResponse(metrics)
+# Rendered exposition is reused across scrapes arriving close together
+RENDER_CACHE_SECONDS = float(os.getenv("METRICS_RENDER_CACHE_SECONDS", "1"))
+METRICS_GZIP_LEVEL = 3
+
+# (plain body, gzipped body) of the last render
+_rendered: TTLValue[Tuple[bytes, bytes]] = TTLValue(RENDER_CACHE_SECONDS)
+
+def _render() -> Tuple[bytes, bytes]:
+    """Render the registry and compress it once for gzip-capable scrapers."""
+    body = generate_latest(exposition_registry)
+    return body, gzip.compress(body, METRICS_GZIP_LEVEL)
 
-async def metrics_updater(node_url: str, network: str):
-    """Update metrics from the node and database."""
-    logger.info("Starting metrics updater")
-    last_node_height = 0
-    last_indexer_height = 0
-    last_update_time = time.time()
+async def _refresh_and_render(request: Request) -> Tuple[bytes, bytes]:
+    """Refresh the node and indexer metrics, then render."""
+    await node_db_collector.refresh(request.app.state.http, request.app.state.pg)
+    return _render()
+
+async def render_metrics(request: Request) -> Response:
+    """Serve the cached exposition, gzipped when the scraper accepts it."""
+    # Overlapping scrapes reuse the first one's render
+    body, gzipped = await _rendered.get(lambda: _refresh_and_render(request))
     
-    while True:
-        try:
-            # Get node height
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(f"{node_url}/info") as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            current_node_height = data.get("fullHeight", 0)
-                            
-                            # Set node info
-                            node_data = {
-                                "network": network,
-                                "version": data.get("appVersion", "unknown"),
-                                "address": node_url
-                            }
-                            node_info.info(node_data)
-                            
-                            # Set node height
-                            node_height.set(current_node_height)
-                            logger.debug(f"Node height: {current_node_height}")
-                        else:
-                            logger.warning(f"Failed to get node info: {response.status}")
-                except Exception as e:
-                    logger.error(f"Error getting node info: {str(e)}")
-            
-            # Get transaction count from database
-            try:
-                # Use a direct PostgreSQL connection instead of SQLAlchemy
-                import psycopg
-                # Get database connection details
-                dsn = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-                
-                # Connect and query
-                with psycopg.connect(dsn) as conn:
-                    # Add a timestamp to avoid any query caching
-                    timestamp = int(time.time())
-                    random_num = random.randint(1, 1000)
-                    
-                    # Simple direct count
-                    with conn.cursor() as cur:
-                        cur.execute(f"SELECT COUNT(*) FROM transactions WHERE 1=1 AND random() < 1.0 AND {timestamp} > 0 AND {random_num} > 0")
-                        tx_count = cur.fetchone()[0]
-                        logger.info(f"Transaction count query result: {tx_count}")
-                    
-                    if tx_count > 0:
-                        total_transactions.set(tx_count)
-                        logger.info(f"Setting total_transactions metric: {tx_count}")
-                    else:
-                        # Fall back to another query method if count returns 0
-                        with conn.cursor() as cur:
-                            cur.execute("SELECT MAX(id) FROM transactions")
-                            max_id = cur.fetchone()[0]
-                            if max_id:
-                                logger.info(f"Max transaction ID: {max_id}")
-                                total_transactions.set(max_id)
-                            else:
-                                logger.warning("No transactions found in database.")
-                    
-                    # Get current indexer height from blocks table
-                    with conn.cursor() as cur:
-                        cur.execute("SELECT MAX(height) FROM blocks")
-                        current_indexer_height = cur.fetchone()[0] or 0
-                        logger.info(f"Current indexer height: {current_indexer_height}")
-                    
-                    if current_indexer_height > 0:
-                        # Set indexer height
-                        indexer_height.set(current_indexer_height)
-                        
-                        # Calculate sync percentage
-                        if current_node_height > 0:
-                            current_sync_percentage = (current_indexer_height / current_node_height) * 100
-                            sync_percentage.set(current_sync_percentage)
-                            logger.info(f"Sync percentage: {current_sync_percentage:.2f}%")
-                        
-                        # Calculate indexing rate
-                        current_time = time.time()
-                        time_diff = current_time - last_update_time
-                        if time_diff > 0 and last_indexer_height > 0:
-                            height_diff = current_indexer_height - last_indexer_height
-                            current_indexing_rate = height_diff / time_diff
-                            indexing_rate.set(current_indexing_rate)
-                            logger.debug(f"Indexing rate: {current_indexing_rate:.2f} blocks/s")
-                        
-                        last_indexer_height = current_indexer_height
-                        last_update_time = current_time
-            
-            except Exception as e:
-                logger.error(f"Error updating metrics from database: {str(e)}")
-                import traceback
-                logger.error(traceback.format_exc())
-        
-        except Exception as e:
-            logger.error(f"Error in metrics updater: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-        
-        # Sleep for 5 seconds
-        await asyncio.sleep(5)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return PlainTextResponse(
+            gzipped, headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    # no-transform keeps proxies from compressing the scrape
+    return PlainTextResponse(
+        body, headers={"Vary": "Accept-Encoding", "Cache-Control": "no-transform"}
+    )
 
 def setup_monitoring(app: FastAPI) -> None:
     """
@@ -244,16 +280,17 @@ def setup_monitoring(app: FastAPI) -> None:
     metrics_endpoint = APIRouter()
     
     @metrics_endpoint.get("/metrics", response_class=PlainTextResponse)
-    async def get_metrics():
+    async def get_metrics(request: Request):
         """
         Endpoint that serves Prometheus metrics.
         """
-        # Use our registry instead of MultiProcessCollector
-        metrics = generate_latest(registry)
-        
-        return PlainTextResponse(metrics)
+        return await render_metrics(request)
     
     app.include_router(metrics_endpoint)
+    app.middleware("http")(monitoring_middleware)
     
-    # We don't need to start metrics_updater here, it's handled in app.py now
-    # The metrics_updater function is not meant to be called directly here
\ No newline at end of file
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        @app.on_event("shutdown")
+        async def mark_worker_dead():
+            # Drop this worker's live gauges from the aggregate
+            multiprocess.mark_process_dead(os.getpid())
@@ -1,23 +1,68 @@
 """Node interaction module."""
 import aiohttp
-from typing import Optional
+from fastapi import Request
+from typing import Any, Dict, Optional
 from ..schemas.status import NodeStatus
 from .config import settings
-import logging
+from .ttl import TTLValue
 
-async def get_node_status() -> NodeStatus:
-    """Get node status from the Ergo node."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{settings.NODE_URL}/info") as response:
+# Node info only changes between blocks, so one fetch can serve every
+# caller for a couple of seconds
+NODE_INFO_TTL = 2.0
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create the application-wide HTTP session for talking to the node."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+    )
+
+def get_http_session(request: Request) -> aiohttp.ClientSession:
+    """Dependency returning the shared HTTP session opened on startup."""
+    return request.app.state.http
+
+class NodeInfoCache:
+    """Short-lived cache of the node /info response shared by all callers."""
+    
+    def __init__(self, node_url: str, ttl: float = NODE_INFO_TTL):
+        """Initialize cache."""
+        self.node_url = node_url
+        self._info: TTLValue[Dict[str, Any]] = TTLValue(ttl)
+        self._etag: Optional[str] = None
+    
+    async def get(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        """Get node info, fetching it at most once per TTL across callers."""
+        return await self._info.get(lambda: self._fetch(session))
+    
+    async def _fetch(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        """Fetch /info, revalidating the last body with its ETag."""
+        data = self._info.value
+        headers = None
+        if self._etag and data is not None:
+            headers = {"If-None-Match": self._etag}
+        async with session.get(f"{self.node_url}/info", headers=headers) as response:
+            if response.status == 304:
+                # Unchanged, keep the parsed body we already have
+                return data
             if response.status != 200:
                 raise RuntimeError(f"Failed to get node status: {response.status}")
             data = await response.json()
-            logging.error(f"Node response data: {data}")  # Debug log
-            return NodeStatus(
-                version=settings.VERSION,
-                network=settings.NETWORK,
-                block_height=data["fullHeight"],
-                is_mining=data["isMining"],
-                peers_count=data["peersCount"],
-                unconfirmed_count=data["unconfirmedCount"]
-            ) 
\ No newline at end of file
+            self._etag = response.headers.get("ETag")
+            return data
+
+node_info_cache = NodeInfoCache(settings.NODE_URL)
+
+async def get_node_status(session: aiohttp.ClientSession) -> NodeStatus:
+    """Get node status from the Ergo node."""
+    data = await node_info_cache.get(session)
+    return NodeStatus(
+        version=settings.VERSION,
+        network=settings.NETWORK,
+        block_height=data["fullHeight"],
+        is_mining=data["isMining"],
+        peers_count=data["peersCount"],
+        unconfirmed_count=data["unconfirmedCount"]
+    )
@@ -0,0 +1,39 @@
+"""Short-lived in-process values shared by concurrent callers."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+class TTLValue(Generic[T]):
+    """
+    One value recomputed at most once per ttl seconds.
+
+    Callers that find it stale queue on a lock, so a burst of them runs the
+    computation once and the rest reuse its result.
+    """
+
+    def __init__(self, ttl: float):
+        """Initialize value."""
+        self.ttl = ttl
+        self.value: Optional[T] = None
+        self.fetched_at = float("-inf")
+        # Created on first use so it binds to the serving event loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    def is_fresh(self) -> bool:
+        """Whether the value was computed less than ttl seconds ago."""
+        return time.monotonic() - self.fetched_at < self.ttl
+
+    async def get(self, compute: Callable[[], Awaitable[T]]) -> T:
+        """Get the value, awaiting compute() first if it is stale."""
+        if self.is_fresh():
+            return self.value
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not self.is_fresh():
+                self.value = await compute()
+                self.fetched_at = time.monotonic()
+            return self.value
@@ -1,17 +1,45 @@
 """Database configuration for the shark-api."""
-from typing import AsyncGenerator
+from typing import Optional
 
+import asyncpg
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.pool import NullPool
 
 from shark_api.core.config import settings
+from shark_api.core.ttl import TTLValue
 from shark_api.db.models import Base
 
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer multiplexes server connections, a client-side pool on top
+    # would only pin them. Prepared statements do not survive transaction
+    # pooling, so the asyncpg statement caches are disabled.
+    pool_options = dict(
+        poolclass=NullPool,
+        connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+    )
+else:
+    # Explicitly sized connection pool
+    pool_options = dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        # Recycling retires idle connections; /ready checks the database instead
+        # of pinging on every checkout
+        pool_pre_ping=False,
+        # Hot lookups stay prepared server-side, skipping parse and plan
+        connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+    )
+
 # Create async engine
 engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
-    echo=True,
+    # Statement logging formats every query and its parameters, debug only
+    echo=settings.DEBUG,
     future=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **pool_options,
 )
 
 # Create async session factory
@@ -23,13 +51,53 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Shared asyncpg pool, opened on startup
+asyncpg_pool: Optional[asyncpg.Pool] = None
+
+# Options for every raw asyncpg pool; behind PgBouncer in transaction mode
+# their prepared statements would not survive either
+asyncpg_pool_options = dict(statement_cache_size=0) if settings.DB_USE_PGBOUNCER else {}
+
 # Export all models
-__all__ = ["Base", "engine", "AsyncSessionLocal"]
-
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session."""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close() 
\ No newline at end of file
+__all__ = ["Base", "engine", "AsyncSessionLocal", "asyncpg_pool", "asyncpg_pool_options"]
+
+async def init_asyncpg_pool() -> asyncpg.Pool:
+    """Open the shared asyncpg pool used by ORM-free read queries."""
+    global asyncpg_pool
+    if asyncpg_pool is None:
+        asyncpg_pool = await asyncpg.create_pool(
+            settings.POSTGRES_DSN,
+            min_size=settings.ASYNCPG_POOL_MIN_SIZE,
+            max_size=settings.ASYNCPG_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime=settings.ASYNCPG_POOL_MAX_INACTIVE_LIFETIME,
+            **asyncpg_pool_options,
+        )
+    return asyncpg_pool
+
+async def close_asyncpg_pool() -> None:
+    """Close the shared asyncpg pool."""
+    global asyncpg_pool
+    if asyncpg_pool is not None:
+        await asyncpg_pool.close()
+        asyncpg_pool = None
+
+# How long the indexed height is reused
+HEIGHT_CACHE_SECONDS = 2.0
+
+class IndexedHeight:
+    """Latest indexed block height, fetched at most once per HEIGHT_CACHE_SECONDS."""
+
+    def __init__(self, ttl: float = HEIGHT_CACHE_SECONDS):
+        """Initialize cache."""
+        self._height: TTLValue[int] = TTLValue(ttl)
+
+    async def get(self) -> int:
+        """Get the latest indexed height."""
+        return await self._height.get(self._fetch)
+
+    async def _fetch(self) -> int:
+        """Read the latest indexed height from the database."""
+        pool = await init_asyncpg_pool()
+        return await pool.fetchval("SELECT MAX(height) FROM blocks") or 0
+
+indexed_height = IndexedHeight()
@@ -1,8 +1,9 @@
 """Database dependencies."""
 from typing import AsyncGenerator
+import asyncpg
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import AsyncSessionLocal
+from .database import AsyncSessionLocal, init_asyncpg_pool
 
 async def get_db() -> AsyncGenerator:
     """
@@ -17,6 +18,15 @@ async def get_db() -> AsyncGenerator:
         finally:
             await session.close()
 
+async def get_pg_pool() -> asyncpg.Pool:
+    """
+    Get the shared asyncpg pool for queries that skip the ORM.
+    
+    Returns:
+        asyncpg.Pool: The pool opened on startup.
+    """
+    return await init_asyncpg_pool()
+
 async def get_db_without_middleware() -> AsyncGenerator:
     """
     Get a database session for background tasks without middleware.
@@ -37,18 +47,4 @@ def get_db_session() -> AsyncSession:
     Returns:
         AsyncSession: An async SQLAlchemy session object.
     """
-    # Make sure we're creating an AsyncSession, not a regular Session
-    from sqlalchemy.ext.asyncio import AsyncSession
-    session = AsyncSessionLocal()
-    
-    # Verify that we're returning an AsyncSession
-    if not isinstance(session, AsyncSession):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Session is not an AsyncSession! Type: {type(session)}")
-        # Try to create an AsyncSession directly
-        from sqlalchemy.ext.asyncio import create_async_session
-        from shark_api.db.database import engine
-        session = create_async_session(engine, expire_on_commit=False)
-    
-    return session 
\ No newline at end of file
+    return AsyncSessionLocal()
@@ -1,5 +1,7 @@
 """Database models for the shark-api."""
-from sqlalchemy import Column, Integer, String, ForeignKey, BigInteger, Float, JSON, Boolean
+from sqlalchemy import (
+    Column, Integer, String, ForeignKey, BigInteger, Float, JSON, Boolean, Index, text
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column, deferred
 from sqlalchemy.ext.declarative import declarative_base
@@ -58,8 +60,9 @@ class Input(Base):
     box_id = Column(String, primary_key=True)
     tx_id = Column(String, ForeignKey("transactions.id"), primary_key=True)
     index_in_tx = Column(Integer, nullable=False)
-    proof_bytes = Column(String)
-    extension = Column(JSON)
+    # Only the transaction detail view reads these, see undefer_group("input_proof")
+    proof_bytes = deferred(Column(String), group="input_proof")
+    extension = deferred(Column(JSON), group="input_proof")
 
     transaction = relationship("Transaction", back_populates="inputs")
 
@@ -73,14 +76,26 @@ class Output(Base):
     value = Column(BigInteger, nullable=False)
     creation_height = Column(Integer, nullable=False)
     address = Column(String)
-    ergo_tree = Column(String, nullable=False)
-    additional_registers = Column(JSON)
+    # Large script payloads, left out of the SELECT list unless undeferred
+    ergo_tree = deferred(Column(String, nullable=False), group="output_script")
+    additional_registers = deferred(Column(JSON), group="output_script")
     spent_by_tx_id = Column(String, ForeignKey("transactions.id"))
 
     transaction = relationship("Transaction", foreign_keys=[tx_id], back_populates="outputs")
     spending_transaction = relationship("Transaction", foreign_keys=[spent_by_tx_id])
     assets = relationship("Asset", back_populates="output")
 
+    __table_args__ = (
+        # Covering index over each address's unspent boxes, so balance
+        # lookups are index-only scans
+        Index(
+            "ix_outputs_utxo",
+            "address",
+            postgresql_where=text("spent_by_tx_id IS NULL"),
+            postgresql_include=["box_id", "value"],
+        ),
+    )
+
 class Asset(Base):
     """Asset model."""
     __tablename__ = "assets"
@@ -95,6 +110,12 @@ class Asset(Base):
 
     output = relationship("Output", back_populates="assets")
 
+    __table_args__ = (
+        Index("assets_box_id_idx", "box_id"),
+        # Per-token supply and holder queries join boxes by box_id
+        Index("assets_token_id_box_id_idx", "token_id", "box_id"),
+    )
+
 class MiningReward(Base):
     """Mining reward model."""
     __tablename__ = "mining_rewards"
@@ -129,6 +150,16 @@ class TokenInfo(Base):
     last_activity = Column(Integer, nullable=True)
     asset_metadata = relationship("AssetMetadata", back_populates="token", uselist=False)
 
+    __table_args__ = (
+        # Trigram index so asset search's ILIKE '%q%' on the ID avoids a seq scan
+        Index(
+            "ix_token_info_id_trgm",
+            "id",
+            postgresql_using="gin",
+            postgresql_ops={"id": "gin_trgm_ops"},
+        ),
+    )
+
 class AssetMetadata(Base):
     """Asset metadata model."""
     __tablename__ = "asset_metadata"
@@ -140,4 +171,13 @@ class AssetMetadata(Base):
     type = Column(String, nullable=True)
     issuer_address = Column(String, nullable=True)
     additional_info = Column(JSON, nullable=True)
-    token = relationship("TokenInfo", back_populates="asset_metadata") 
\ No newline at end of file
+    token = relationship("TokenInfo", back_populates="asset_metadata") 
+
+    __table_args__ = (
+        Index(
+            "ix_asset_metadata_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
\ No newline at end of file
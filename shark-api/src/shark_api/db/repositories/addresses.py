@@ -1,62 +1,129 @@
 """Address repository."""
 from typing import Optional, List, Dict, Any
-from sqlalchemy import select, func, desc
-from sqlalchemy.orm import joinedload
+import asyncpg
+from sqlalchemy import select, func, desc, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
 from ..models import Output, Asset, AddressStats
-from ...schemas.addresses import AddressDetail, AddressBalance
+from ...schemas.addresses import AddressDetail, AddressBalance, AddressStats as AddressStatsSchema
+
+# Unspent value and per-token amounts in one pass over the address's UTXOs.
+# The LEFT JOIN keeps a single row with NULL token_id when there are no assets.
+ADDRESS_BALANCE_QUERY = """
+WITH utxos AS (
+    SELECT box_id, value FROM outputs
+    WHERE address = $1 AND spent_by_tx_id IS NULL
+), totals AS (
+    SELECT COALESCE(SUM(value), 0) AS confirmed FROM utxos
+)
+SELECT t.confirmed, a.token_id, SUM(a.amount) AS amount, a.name, a.decimals
+FROM totals t
+LEFT JOIN (utxos u JOIN assets a ON a.box_id = u.box_id) ON true
+GROUP BY t.confirmed, a.token_id, a.name, a.decimals
+"""
+
+# Balance, activity and stored stats for the details endpoint in one
+# statement: one round trip, and every figure comes from the same snapshot.
+# The summary is repeated on each asset row, or on a single row with NULL
+# token_id when the address holds no assets.
+ADDRESS_DETAILS_QUERY = """
+WITH utxos AS (
+    SELECT box_id, value FROM outputs
+    WHERE address = $1 AND spent_by_tx_id IS NULL
+), activity AS (
+    SELECT
+        MIN(t.timestamp) AS first_active,
+        MAX(t.timestamp) AS last_active,
+        COALESCE(SUM(o.value), 0) AS total_received,
+        COALESCE(SUM(o.value) FILTER (WHERE o.spent_by_tx_id IS NOT NULL), 0) AS total_sent
+    FROM outputs o
+    JOIN transactions t ON t.id = o.tx_id
+    WHERE o.address = $1
+), summary AS (
+    SELECT
+        (SELECT COALESCE(SUM(value), 0) FROM utxos) AS confirmed,
+        COALESCE(s.first_active_time, act.first_active) AS first_active,
+        COALESCE(s.last_active_time, act.last_active) AS last_active,
+        (
+            SELECT COUNT(*) FROM (
+                SELECT tx_id FROM outputs WHERE address = $1
+                UNION
+                SELECT spent_by_tx_id FROM outputs
+                WHERE address = $1 AND spent_by_tx_id IS NOT NULL
+            ) txs
+        ) AS total_transactions,
+        act.total_received,
+        act.total_sent,
+        s.address_type,
+        s.script_complexity
+    FROM activity act
+    LEFT JOIN address_stats s ON s.address = $1
+)
+SELECT sm.*, b.token_id, b.amount, b.name, b.decimals
+FROM summary sm
+LEFT JOIN (
+    SELECT a.token_id, SUM(a.amount) AS amount, a.name, a.decimals
+    FROM utxos u JOIN assets a ON a.box_id = u.box_id
+    GROUP BY a.token_id, a.name, a.decimals
+) b ON true
+"""
+
+def _balance_from_rows(rows: List[Any]) -> AddressBalance:
+    """Split fused balance rows into the confirmed total and asset list."""
+    return AddressBalance(
+        confirmed=rows[0]["confirmed"] if rows else 0,
+        unconfirmed=0,  # We don't track mempool yet
+        assets=[
+            {
+                'token_id': row["token_id"],
+                'amount': row["amount"],
+                'name': row["name"],
+                'decimals': row["decimals"]
+            }
+            for row in rows
+            if row["token_id"] is not None
+        ]
+    )
 
 class AddressRepository:
     """Repository for address operations."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, pool: Optional[asyncpg.Pool] = None):
         """Initialize repository."""
         self.session = session
+        self.pool = pool
+
+    async def get_address_balance_fast(self, address: str) -> AddressBalance:
+        """Get address balance straight from asyncpg, skipping ORM compilation."""
+        return _balance_from_rows(await self.pool.fetch(ADDRESS_BALANCE_QUERY, address))
 
     async def get_address_balance(self, address: str) -> AddressBalance:
         """Get address balance."""
-        # Get confirmed balance
-        balance_result = await self.session.execute(
-            select(func.sum(Output.value))
+        # Same single pass as ADDRESS_BALANCE_QUERY, built with SQLAlchemy
+        utxos = (
+            select(Output.box_id, Output.value)
             .where(
                 Output.address == address,
                 Output.spent_by_tx_id.is_(None)
             )
+            .cte("utxos")
         )
-        confirmed = balance_result.scalar_one() or 0
-
-        # Get asset balances
-        asset_result = await self.session.execute(
+        totals = select(func.coalesce(func.sum(utxos.c.value), 0).label('confirmed')).cte("totals")
+        result = await self.session.execute(
             select(
+                totals.c.confirmed,
                 Asset.token_id,
                 func.sum(Asset.amount).label('amount'),
                 Asset.name,
                 Asset.decimals
             )
-            .join(Output, Asset.box_id == Output.box_id)
-            .where(
-                Output.address == address,
-                Output.spent_by_tx_id.is_(None)
+            .select_from(
+                totals.outerjoin(utxos.join(Asset, Asset.box_id == utxos.c.box_id), true())
             )
-            .group_by(Asset.token_id, Asset.name, Asset.decimals)
-        )
-        assets = [
-            {
-                'token_id': token_id,
-                'amount': amount,
-                'name': name,
-                'decimals': decimals
-            }
-            for token_id, amount, name, decimals in asset_result
-        ]
-
-        return AddressBalance(
-            confirmed=confirmed,
-            unconfirmed=0,  # We don't track mempool yet
-            assets=assets
+            .group_by(totals.c.confirmed, Asset.token_id, Asset.name, Asset.decimals)
         )
+        return _balance_from_rows(result.mappings().all())
 
     async def get_address_stats(self, address: str) -> Optional[AddressStats]:
         """Get address statistics."""
@@ -66,48 +133,19 @@ class AddressRepository:
         return result.scalar_one_or_none()
 
     async def get_address_details(self, address: str) -> AddressDetail:
-        """Get address details."""
-        # Get balance
-        balance = await self.get_address_balance(address)
-        
-        # Get stats
-        stats = await self.get_address_stats(address)
-        
-        # Get first and last transaction times if no stats
-        if not stats:
-            time_result = await self.session.execute(
-                select(
-                    func.min(Output.created_at),
-                    func.max(Output.created_at)
-                )
-                .where(Output.address == address)
-            )
-            first_seen, last_seen = time_result.one()
-            
-            # Get total received
-            received_result = await self.session.execute(
-                select(func.sum(Output.value))
-                .where(Output.address == address)
-            )
-            total_received = received_result.scalar_one() or 0
-            
-            # Get total sent
-            sent_result = await self.session.execute(
-                select(func.sum(Output.value))
-                .join(Output, Output.box_id == Input.box_id)
-                .where(Output.address == address)
-            )
-            total_sent = sent_result.scalar_one() or 0
-            
-            stats = AddressStats(
-                first_active=int(first_seen.timestamp()) if first_seen else None,
-                last_active=int(last_seen.timestamp()) if last_seen else None,
-                total_received=total_received,
-                total_sent=total_sent
-            )
-
+        """Get address details in a single query over the asyncpg pool."""
+        rows = await self.pool.fetch(ADDRESS_DETAILS_QUERY, address)
+        summary = rows[0]
         return AddressDetail(
             address=address,
-            balance=balance,
-            stats=stats
-        ) 
\ No newline at end of file
+            balance=_balance_from_rows(rows),
+            stats=AddressStatsSchema(
+                first_active=summary["first_active"],
+                last_active=summary["last_active"],
+                total_transactions=summary["total_transactions"],
+                total_received=summary["total_received"],
+                total_sent=summary["total_sent"]
+            ),
+            script_type=summary["address_type"],
+            script_complexity=summary["script_complexity"]
+        )
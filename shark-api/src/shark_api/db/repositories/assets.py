@@ -1,12 +1,12 @@
 """Asset repository."""
-from typing import Optional, List, Dict, Any
-from sqlalchemy import select, func, desc, or_
-from sqlalchemy.orm import joinedload
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import select, func, desc, or_, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
-from ..models import Asset, TokenInfo, AssetMetadata, Output
-from ...schemas.assets import AssetDetail, AssetSummary, AssetList
+from ...core.cache import token_info_cache
+from ..models import Asset, TokenInfo, AssetMetadata, Output, Transaction
+from ...schemas.assets import AssetDetail, AssetSummary
 
 class AssetRepository:
     """Repository for asset operations."""
@@ -17,108 +17,174 @@ class AssetRepository:
 
     async def get_asset_details(self, token_id: str) -> Optional[AssetDetail]:
         """Get asset details."""
-        # Get token info
-        token_result = await self.session.execute(
-            select(TokenInfo)
-            .where(TokenInfo.token_id == token_id)
-            .options(joinedload(TokenInfo.metadata))
-        )
-        token = token_result.scalar_one_or_none()
-        if not token:
-            return None
-
-        # Get circulating supply
-        supply_result = await self.session.execute(
-            select(func.sum(Asset.amount))
-            .join(Output, Asset.box_id == Output.box_id)
-            .where(
-                Asset.token_id == token_id,
-                Output.spent_by_tx_id.is_(None)
+        # Supply and holders over unspent boxes; aggregates without GROUP BY
+        # always yield one row, so both join the token row unconditionally
+        unspent = (
+            select(
+                func.coalesce(func.sum(Asset.amount), 0).label("circulating_supply"),
+                func.count(func.distinct(Output.address)).label("holders_count")
             )
-        )
-        circulating_supply = supply_result.scalar_one() or 0
-
-        # Get holders count
-        holders_result = await self.session.execute(
-            select(func.count(func.distinct(Output.address)))
-            .join(Asset, Asset.box_id == Output.box_id)
+            .select_from(Asset)
+            .join(Output, Asset.box_id == Output.box_id)
             .where(
                 Asset.token_id == token_id,
                 Output.spent_by_tx_id.is_(None)
             )
+            .subquery("unspent")
         )
-        holders_count = holders_result.scalar_one() or 0
-
-        # Get first and last activity
-        activity_result = await self.session.execute(
+        activity = (
             select(
-                func.min(Asset.created_at),
-                func.max(Asset.created_at)
+                func.min(Transaction.timestamp).label("first_minted"),
+                func.max(Transaction.timestamp).label("last_activity")
             )
+            .select_from(Asset)
+            .join(Output, Asset.box_id == Output.box_id)
+            .join(Transaction, Transaction.id == Output.tx_id)
             .where(Asset.token_id == token_id)
+            .subquery("activity")
         )
-        first_seen, last_seen = activity_result.one()
+
+        # Token metadata never changes after mint, only the aggregates are live
+        token = await token_info_cache.get(token_id)
+        if token is None:
+            # Token info and every aggregate in a single round trip
+            query = (
+                select(TokenInfo, AssetMetadata, unspent, activity)
+                .select_from(TokenInfo)
+                .outerjoin(AssetMetadata, AssetMetadata.token_id == TokenInfo.id)
+                .join(unspent, true())
+                .join(activity, true())
+                .where(TokenInfo.id == token_id)
+            )
+        else:
+            query = select(unspent, activity).select_from(unspent).join(activity, true())
+        row = (await self.session.execute(query)).one_or_none()
+        if row is None:
+            return None
+        if token is None:
+            token = self._token_fields(row.TokenInfo, row.AssetMetadata)
+            await token_info_cache.set(token_id, token)
 
         return AssetDetail(
             id=token_id,
-            box_id=token.metadata.box_id if token.metadata else None,
-            metadata={
-                'name': token.name,
-                'description': token.description,
-                'decimals': token.decimals,
-                'type': token.metadata.asset_type if token.metadata else None,
-                'issuer_address': token.metadata.issuer_address if token.metadata else None,
-                'additional_info': token.metadata.metadata if token.metadata else None
-            },
-            total_supply=token.total_supply,
-            circulating_supply=circulating_supply,
-            holders_count=holders_count,
-            first_minted=int(first_seen.timestamp()) if first_seen else None,
-            last_activity=int(last_seen.timestamp()) if last_seen else None
+            box_id=token['box_id'],
+            metadata=token['metadata'],
+            total_supply=token['total_supply'],
+            circulating_supply=row.circulating_supply,
+            holders_count=row.holders_count,
+            first_minted=row.first_minted,
+            last_activity=row.last_activity
         )
 
-    async def search_assets(
+    @staticmethod
+    def _token_fields(token: TokenInfo, metadata: Optional[AssetMetadata]) -> Dict[str, Any]:
+        """Cacheable, mint-time fields of a token."""
+        return {
+            'box_id': token.box_id,
+            'total_supply': token.total_supply,
+            'metadata': {
+                'name': metadata.name if metadata else None,
+                'description': metadata.description if metadata else None,
+                'decimals': metadata.decimals if metadata else None,
+                'type': metadata.type if metadata else None,
+                'issuer_address': metadata.issuer_address if metadata else None,
+                'additional_info': metadata.additional_info if metadata else None
+            }
+        }
+
+    @staticmethod
+    def _search_query(query: str):
+        """Matching tokens with their metadata, in name then token ID order."""
+        # Tokens without metadata sort first instead of breaking the tuple comparison
+        sort_name = func.coalesce(AssetMetadata.name, "").label("sort_name")
+        return (
+            select(TokenInfo, AssetMetadata, sort_name)
+            .outerjoin(AssetMetadata, AssetMetadata.token_id == TokenInfo.id)
+            .where(
+                or_(
+                    AssetMetadata.name.ilike(f"%{query}%"),
+                    TokenInfo.id.ilike(f"%{query}%")
+                )
+            )
+            .order_by(sort_name, TokenInfo.id)
+        ), sort_name
+
+    @staticmethod
+    def _search_items(rows: List[Any]) -> List[AssetSummary]:
+        """Build asset summaries from (token, metadata, ...) rows."""
+        return [
+            AssetSummary(
+                id=row[0].id,
+                name=row[1].name if row[1] else None,
+                decimals=row[1].decimals if row[1] else None,
+                total_supply=row[0].total_supply,
+                type=row[1].type if row[1] else None
+            )
+            for row in rows
+        ]
+
+    async def search_assets_with_total(
         self,
         query: str,
         skip: int = 0,
         limit: int = 100
-    ) -> AssetList:
-        """Search assets by name or ID."""
-        # Search query
-        search_query = select(TokenInfo).where(
-            or_(
-                TokenInfo.name.ilike(f"%{query}%"),
-                TokenInfo.token_id.ilike(f"%{query}%")
-            )
-        )
-
-        # Get total count
-        count_result = await self.session.execute(
-            select(func.count()).select_from(search_query.subquery())
-        )
-        total = count_result.scalar_one()
+    ) -> Tuple[List[AssetSummary], int, Optional[Tuple[str, str]]]:
+        """
+        Search assets by name or ID, returning a page and the total match count.
 
-        # Get paginated results
+        The key of the last row is returned so callers can continue with
+        keyset pagination.
+        """
+        search, _ = self._search_query(query)
+        # Page of matching tokens plus the total match count in one query
         result = await self.session.execute(
-            search_query
-            .order_by(TokenInfo.name)
+            search.add_columns(func.count().over().label("total"))
             .offset(skip)
             .limit(limit)
         )
-        tokens = result.scalars().all()
-
-        return AssetList(
-            items=[
-                AssetSummary(
-                    id=token.token_id,
-                    name=token.name,
-                    decimals=token.decimals,
-                    total_supply=token.total_supply,
-                    type=token.metadata.asset_type if token.metadata else None
+        rows = result.all()
+        if not rows:
+            # Past the last page the window has nothing to count
+            total = 0
+            if skip > 0:
+                result = await self.session.execute(
+                    select(func.count()).select_from(search.subquery())
                 )
-                for token in tokens
-            ],
-            total=total,
-            page=skip // limit + 1,
-            page_size=limit
-        ) 
\ No newline at end of file
+                total = result.scalar_one()
+            return [], total, None
+
+        total = rows[0].total
+        next_key = (rows[-1].sort_name, rows[-1][0].id) if skip + len(rows) < total else None
+        return self._search_items(rows), total, next_key
+
+    async def search_assets_after(
+        self,
+        query: str,
+        after: Optional[Tuple[str, str]] = None,
+        limit: int = 100
+    ) -> Tuple[List[AssetSummary], Optional[Tuple[str, str]]]:
+        """
+        Search assets by name or ID using keyset pagination.
+
+        Args:
+            query: Name or token ID fragment
+            after: (name, token_id) of the last row already seen, or None for
+                the first page
+            limit: Page size
+
+        Returns:
+            The page and the key to continue after, None on the last page
+        """
+        search, sort_name = self._search_query(query)
+        if after is not None:
+            search = search.where(tuple_(sort_name, TokenInfo.id) > tuple_(*after))
+
+        rows = (await self.session.execute(search.limit(limit + 1))).all()
+
+        # The extra row only tells us whether another page exists
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_key = (rows[-1].sort_name, rows[-1][0].id)
+
+        return self._search_items(rows), next_key
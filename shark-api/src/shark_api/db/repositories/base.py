@@ -1,11 +1,13 @@
 """Base repository class."""
-from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
-from sqlalchemy import select, func
+from typing import Generic, TypeVar, Type, Optional, List, Any, Dict, Tuple
+from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
 ModelType = TypeVar("ModelType")
 
+TABLE_ESTIMATE_QUERY = "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"
+
 class BaseRepository(Generic[ModelType]):
     """Base class for all repositories."""
 
@@ -43,13 +45,73 @@ class BaseRepository(Generic[ModelType]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
-    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
-        """Count records."""
+    async def get_multi_with_total(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[Any] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        conditions: Optional[List[Any]] = None
+    ) -> Tuple[List[ModelType], int]:
+        """Get a page of records and the total match count in one query."""
+        query = select(self.model, func.count().over().label("total"))
+        
+        if filters:
+            query = self.filter_query(query, filters)
+        if conditions:
+            query = query.where(*conditions)
+                
+        if order_by is not None:
+            query = query.order_by(order_by)
+            
+        query = query.offset(skip).limit(limit)
+        result = await self.session.execute(query)
+        rows = result.all()
+        
+        if not rows:
+            # Past the last page the window has nothing to count; count
+            # exactly so the total matches the one on earlier pages
+            if skip > 0:
+                return [], await self.exact_count(filters, conditions)
+            return [], 0
+        return [row[0] for row in rows], rows[0].total
+
+    async def count(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        conditions: Optional[List[Any]] = None
+    ) -> int:
+        """
+        Count records.
+
+        Without filters this is the planner's row estimate for the table, a
+        catalog lookup instead of a full scan. The estimate is only as fresh
+        as the last autovacuum/ANALYZE.
+        """
+        if not filters and not conditions:
+            result = await self.session.execute(
+                text(TABLE_ESTIMATE_QUERY), {"table": self.model.__tablename__}
+            )
+            estimate = result.scalar_one_or_none() or 0
+            # reltuples is -1 (or 0) until the table is first analyzed
+            if estimate > 0:
+                return estimate
+        return await self.exact_count(filters, conditions)
+
+    async def exact_count(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        conditions: Optional[List[Any]] = None
+    ) -> int:
+        """Count matching records with COUNT(*)."""
         query = select(func.count()).select_from(self.model)
         
         if filters:
             for field, value in filters.items():
                 query = query.where(getattr(self.model, field) == value)
+        if conditions:
+            query = query.where(*conditions)
                 
         result = await self.session.execute(query)
         return result.scalar_one()
@@ -1,49 +1,52 @@
 """Repository for block-related database operations."""
 import logging
-from typing import Optional, List, Tuple
-from sqlalchemy import select, func
+from typing import Any, Optional, List, Tuple
+import asyncpg
+import orjson
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from shark_api.db.models import Block, MiningReward
+from shark_api.db.models import Block
 from shark_api.schemas.blocks import BlockDetail
 from shark_api.db.repositories.base import BaseRepository
+from shark_api.db.statements import BLOCK_BY_HASH, BLOCK_BY_HEIGHT, BLOCKS_RANGE, LATEST_BLOCK
+
+# A block and its child rows as JSON in one round trip; the aggregates fall
+# back to empty arrays so a block without rewards still yields one row.
+# pow_solutions comes back as its stored text and is spliced into the
+# response as is, never decoded.
+BLOCK_DETAILS_QUERY = """
+SELECT
+    to_jsonb(b) - 'pow_solutions' AS block,
+    b.pow_solutions::text AS pow_solutions,
+    (
+        SELECT COALESCE(jsonb_agg(to_jsonb(t) ORDER BY t.index), '[]'::jsonb)
+        FROM transactions t WHERE t.block_id = b.id
+    ) AS transactions,
+    (
+        SELECT COALESCE(jsonb_agg(to_jsonb(r)), '[]'::jsonb)
+        FROM mining_rewards r WHERE r.block_id = b.id
+    ) AS mining_rewards
+FROM blocks b
+WHERE b.{column} = $1
+"""
+BLOCK_DETAILS_BY_ID_QUERY = BLOCK_DETAILS_QUERY.format(column="id")
+BLOCK_DETAILS_BY_HEIGHT_QUERY = BLOCK_DETAILS_QUERY.format(column="height")
 
 class BlockRepository(BaseRepository[Block]):
     """Repository for block-related database operations."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, pool: Optional[asyncpg.Pool] = None):
         """Initialize repository."""
         super().__init__(Block, session)
+        self.pool = pool
         self.logger = logging.getLogger(__name__)
 
     async def get_latest(self) -> Optional[Block]:
         """Get latest block."""
         try:
-            result = await self.session.execute(
-                select(
-                    Block.id,
-                    Block.header_id,
-                    Block.parent_id,
-                    Block.height,
-                    Block.timestamp,
-                    Block.difficulty,
-                    Block.block_size,
-                    Block.block_coins,
-                    Block.block_mining_time,
-                    Block.txs_count,
-                    Block.txs_size,
-                    Block.miner_address,
-                    Block.miner_name,
-                    Block.main_chain,
-                    Block.version,
-                    Block.transactions_root,
-                    Block.state_root,
-                    Block.pow_solutions
-                )
-                .order_by(Block.height.desc())
-                .limit(1)
-            )
+            result = await self.session.execute(LATEST_BLOCK)
             return result.scalar_one_or_none()
         except Exception as e:
             self.logger.error(f"Error getting latest block: {e}")
@@ -65,114 +68,63 @@ class BlockRepository(BaseRepository[Block]):
 
     async def get_by_height(self, height: int) -> Optional[Block]:
         """Get block by height."""
-        result = await self.session.execute(
-            select(
-                Block.id,
-                Block.header_id,
-                Block.parent_id,
-                Block.height,
-                Block.timestamp,
-                Block.difficulty,
-                Block.block_size,
-                Block.block_coins,
-                Block.block_mining_time,
-                Block.txs_count,
-                Block.txs_size,
-                Block.miner_address,
-                Block.miner_name,
-                Block.main_chain,
-                Block.version,
-                Block.transactions_root,
-                Block.state_root,
-                Block.pow_solutions
-            ).where(Block.height == height)
-        )
+        result = await self.session.execute(BLOCK_BY_HEIGHT, {"height": height})
         return result.scalar_one_or_none()
 
     async def get_by_hash(self, block_hash: str) -> Optional[Block]:
         """Get block by hash."""
-        result = await self.session.execute(
-            select(
-                Block.id,
-                Block.header_id,
-                Block.parent_id,
-                Block.height,
-                Block.timestamp,
-                Block.difficulty,
-                Block.block_size,
-                Block.block_coins,
-                Block.block_mining_time,
-                Block.txs_count,
-                Block.txs_size,
-                Block.miner_address,
-                Block.miner_name,
-                Block.main_chain,
-                Block.version,
-                Block.transactions_root,
-                Block.state_root,
-                Block.pow_solutions
-            ).where(Block.id == block_hash)
-        )
+        result = await self.session.execute(BLOCK_BY_HASH, {"block_id": block_hash})
         return result.scalar_one_or_none()
 
     async def get_blocks_range(self, start_height: int, end_height: int) -> List[Block]:
         """Get blocks within a height range."""
         result = await self.session.execute(
-            select(
-                Block.id,
-                Block.header_id,
-                Block.parent_id,
-                Block.height,
-                Block.timestamp,
-                Block.difficulty,
-                Block.block_size,
-                Block.block_coins,
-                Block.block_mining_time,
-                Block.txs_count,
-                Block.txs_size,
-                Block.miner_address,
-                Block.miner_name,
-                Block.main_chain,
-                Block.version,
-                Block.transactions_root,
-                Block.state_root,
-                Block.pow_solutions
-            )
-            .where(Block.height >= start_height)
-            .where(Block.height <= end_height)
-            .order_by(Block.height.desc())
+            BLOCKS_RANGE, {"start_height": start_height, "end_height": end_height}
         )
         return result.scalars().all()
 
-    async def get_block_with_details(self, block_id: str) -> Optional[BlockDetail]:
-        """Get block with transaction and mining reward details."""
+    async def get_blocks_page(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        from_height: Optional[int] = None,
+        to_height: Optional[int] = None
+    ) -> Tuple[List[Block], int]:
+        """Get a page of blocks, newest first, with the total match count."""
+        conditions = []
+        if from_height is not None:
+            conditions.append(Block.height >= from_height)
+        if to_height is not None:
+            conditions.append(Block.height <= to_height)
+        return await self.get_multi_with_total(
+            skip=skip,
+            limit=limit,
+            order_by=Block.height.desc(),
+            conditions=conditions
+        )
+
+    async def _block_details(self, query: str, key: Any) -> Optional[BlockDetail]:
+        """Build block details from one BLOCK_DETAILS_QUERY row."""
         try:
-            # First, try to fetch the block
-            block_query = select(Block).where(Block.id == block_id)
-            block_result = await self.session.execute(block_query)
-            block = block_result.scalar_one_or_none()
-            
-            if not block:
-                return None
-                
-            # Fetch transactions separately
-            from sqlalchemy.orm import joinedload
-            from ..models import Transaction
-            transactions_query = select(Transaction).where(Transaction.block_id == block_id)
-            transactions_result = await self.session.execute(transactions_query)
-            transactions = transactions_result.scalars().all()
-            
-            # Fetch mining rewards separately
-            rewards_query = select(MiningReward).where(MiningReward.block_id == block_id)
-            rewards_result = await self.session.execute(rewards_query)
-            mining_rewards = rewards_result.scalars().all()
-            
-            # Create the result
-            return BlockDetail(
-                block=block,
-                transactions=transactions,
-                mining_rewards=mining_rewards
-            )
+            row = await self.pool.fetchrow(query, key)
         except Exception as e:
             self.logger.error(f"Error in get_block_with_details: {e}")
-            raise 
\ No newline at end of file
+            raise
+        if row is None:
+            return None
+        block = orjson.loads(row["block"])
+        if row["pow_solutions"] is not None:
+            block["pow_solutions"] = orjson.Fragment(row["pow_solutions"])
+        return BlockDetail.from_orm({
+            "block": block,
+            "transactions": orjson.loads(row["transactions"]),
+            "mining_rewards": orjson.loads(row["mining_rewards"])
+        })
+
+    async def get_block_with_details(self, block_id: str) -> Optional[BlockDetail]:
+        """Get block with transaction and mining reward details."""
+        return await self._block_details(BLOCK_DETAILS_BY_ID_QUERY, block_id)
+
+    async def get_block_with_details_by_height(self, height: int) -> Optional[BlockDetail]:
+        """Get block at a height with transaction and mining reward details."""
+        return await self._block_details(BLOCK_DETAILS_BY_HEIGHT_QUERY, height)
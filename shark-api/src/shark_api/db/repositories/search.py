@@ -1,10 +1,15 @@
 """Search repository."""
+import asyncio
 from typing import Optional, List, Dict, Any
 from sqlalchemy import select, or_, desc
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql import Select
 
-from ..models import Block, Transaction, Output, TokenInfo
+from ..models import Block, Transaction, Output, TokenInfo, AssetMetadata
+from ...schemas.base import construct_all
+from ...schemas.blocks import BlockBase
 from ...schemas.search import SearchResult
+from ...schemas.transactions import TransactionBase
 
 class SearchRepository:
     """Repository for search operations."""
@@ -12,61 +17,74 @@ class SearchRepository:
     def __init__(self, session: AsyncSession):
         """Initialize repository."""
         self.session = session
+        # An AsyncSession serialises its statements on one connection, so
+        # each lookup gets its own session on the injected session's engine
+        self._sessions = async_sessionmaker(
+            session.bind, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+
+    async def _fetch(self, query: Select) -> List[Any]:
+        """Run a query on its own pooled session so searches can overlap."""
+        async with self._sessions() as session:
+            result = await session.execute(query)
+            return result.all()
 
     async def search(self, query: str, limit: int = 10) -> SearchResult:
         """Search across all entities."""
-        # Search blocks
-        block_result = await self.session.execute(
-            select(Block)
-            .where(
-                or_(
-                    Block.id.ilike(f"%{query}%"),
-                    Block.height == query if query.isdigit() else False
-                )
-            )
-            .order_by(desc(Block.height))
-            .limit(limit)
-        )
-        blocks = block_result.scalars().all()
+        pattern = f"%{query}%"
 
-        # Search transactions
-        tx_result = await self.session.execute(
-            select(Transaction)
-            .where(Transaction.id.ilike(f"%{query}%"))
-            .order_by(desc(Transaction.timestamp))
-            .limit(limit)
-        )
-        transactions = tx_result.scalars().all()
-
-        # Search addresses
-        address_result = await self.session.execute(
-            select(Output.address)
-            .where(Output.address.ilike(f"%{query}%"))
-            .distinct()
-            .limit(limit)
-        )
-        addresses = [row[0] for row in address_result if row[0]]
+        # Height only matches numeric queries, leave it out of the plan otherwise
+        block_match = Block.id.ilike(pattern)
+        if query.isdigit():
+            block_match = or_(block_match, Block.height == int(query))
 
-        # Search assets
-        asset_result = await self.session.execute(
-            select(TokenInfo.token_id)
-            .where(
-                or_(
-                    TokenInfo.token_id.ilike(f"%{query}%"),
-                    TokenInfo.name.ilike(f"%{query}%")
+        # The four lookups are independent, run them concurrently
+        block_rows, tx_rows, address_rows, asset_rows = await asyncio.gather(
+            self._fetch(
+                select(Block)
+                .where(block_match)
+                .order_by(desc(Block.height))
+                .limit(limit)
+            ),
+            self._fetch(
+                select(Transaction)
+                .where(Transaction.id.ilike(pattern))
+                .order_by(desc(Transaction.timestamp))
+                .limit(limit)
+            ),
+            self._fetch(
+                select(Output.address)
+                .where(Output.address.ilike(pattern))
+                .distinct()
+                .limit(limit)
+            ),
+            self._fetch(
+                select(TokenInfo.id)
+                .outerjoin(AssetMetadata, AssetMetadata.token_id == TokenInfo.id)
+                .where(
+                    or_(
+                        TokenInfo.id.ilike(pattern),
+                        AssetMetadata.name.ilike(pattern)
+                    )
                 )
+                .limit(limit)
             )
-            .limit(limit)
         )
-        assets = [row[0] for row in asset_result]
 
-        return SearchResult(
-            blocks=blocks,
-            transactions=transactions,
+        blocks = [row[0] for row in block_rows]
+        transactions = [row[0] for row in tx_rows]
+        addresses = [row[0] for row in address_rows if row[0]]
+        assets = [row[0] for row in asset_rows]
+
+        # Rows are typed by the database schema; building the result without
+        # validation avoids copying every ORM row through its validators
+        return SearchResult.construct(
+            blocks=construct_all(BlockBase, blocks),
+            transactions=construct_all(TransactionBase, transactions),
             addresses=addresses,
             assets=assets,
             total_blocks=len(blocks),
             total_transactions=len(transactions),
             total_addresses=len(addresses),
             total_assets=len(assets)
-        ) 
\ No newline at end of file
+        )
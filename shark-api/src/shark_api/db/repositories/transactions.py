@@ -1,16 +1,24 @@
 """Transaction repository."""
-from typing import Optional, List, Dict, Any
-from sqlalchemy import select, desc, func, text
-from sqlalchemy.orm import joinedload
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy import select, desc, func, literal, text, tuple_, union_all
+from sqlalchemy.orm import joinedload, undefer_group
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from .base import BaseRepository
+from ..database import indexed_height
 from ..models import Transaction, Input, Output, Asset
-from ...schemas.transactions import TransactionDetail, AddressTransaction
+from ...schemas.base import construct_all, construct_from
+from ...schemas.transactions import TransactionDetail, AddressTransaction, AssetBase
 
 logger = logging.getLogger(__name__)
 
+TX_COUNT_ESTIMATE_QUERY = "SELECT reltuples::bigint FROM pg_class WHERE relname = 'transactions'"
+
+# Past this many rows an address count is reported as ADDRESS_COUNT_CAP + 1
+ADDRESS_COUNT_CAP = 10000
+
 class TransactionRepository(BaseRepository[Transaction]):
     """Repository for transaction operations."""
     
@@ -24,132 +32,195 @@ class TransactionRepository(BaseRepository[Transaction]):
             select(Transaction)
             .where(Transaction.id == tx_id)
             .options(
-                joinedload(Transaction.inputs),
-                joinedload(Transaction.outputs).joinedload(Output.assets)
+                joinedload(Transaction.inputs).undefer_group("input_proof"),
+                joinedload(Transaction.outputs).options(
+                    undefer_group("output_script"),
+                    joinedload(Output.assets)
+                )
             )
         )
-        tx = result.scalar_one_or_none()
+        # Joined collections repeat the parent row, unique() folds them back
+        tx = result.unique().scalar_one_or_none()
         if not tx:
             return None
 
-        # Get current height for confirmations
-        height_result = await self.session.execute(
-            select(func.max(Transaction.inclusion_height))
-        )
-        current_height = height_result.scalar_one() or tx.inclusion_height
+        # Tip height is shared and refreshed at most every couple of seconds,
+        # it may briefly trail a transaction that was just indexed
+        current_height = max(await indexed_height.get(), tx.inclusion_height)
         confirmations = current_height - tx.inclusion_height + 1
 
-        return TransactionDetail(
-            **tx.__dict__,
-            inputs=[input.__dict__ for input in tx.inputs],
-            outputs=[{
-                **output.__dict__,
-                'assets': [asset.__dict__ for asset in output.assets]
-            } for output in tx.outputs],
-            confirmations=confirmations
-        )
+        # Inputs, outputs and their assets come from typed columns; build the
+        # whole tree without running a validator per box
+        detail = construct_from(TransactionDetail, tx)
+        detail.confirmations = confirmations
+        return detail
 
-    async def get_address_transactions(
-        self,
-        address: str,
-        skip: int = 0,
-        limit: int = 100
-    ) -> List[AddressTransaction]:
-        """Get transactions for address."""
-        # Get transactions where address is in inputs
-        input_txs = await self.session.execute(
-            select(Transaction, Input)
+    def _address_rows(self, address: str):
+        """Subquery of every box spent or received by address, one row each."""
+        columns = (
+            Transaction.id,
+            Transaction.timestamp,
+            Transaction.inclusion_height,
+            Transaction.index.label("tx_index"),
+            Output.value,
+            Output.box_id
+        )
+        spent = (
+            select(*columns, literal("input").label("type"))
             .join(Input, Transaction.id == Input.tx_id)
             .join(Output, Input.box_id == Output.box_id)
             .where(Output.address == address)
-            .order_by(desc(Transaction.timestamp))
-            .offset(skip)
-            .limit(limit)
         )
-
-        # Get transactions where address is in outputs
-        output_txs = await self.session.execute(
-            select(Transaction, Output)
+        received = (
+            select(*columns, literal("output").label("type"))
             .join(Output, Transaction.id == Output.tx_id)
             .where(Output.address == address)
-            .order_by(desc(Transaction.timestamp))
-            .offset(skip)
-            .limit(limit)
         )
+        return union_all(spent, received).subquery()
 
-        # Combine and format results
-        transactions = []
-        for tx, box in input_txs:
-            transactions.append(
-                AddressTransaction(
-                    id=tx.id,
-                    timestamp=tx.timestamp,
-                    type="input",
-                    value=box.value,
-                    assets=[asset.__dict__ for asset in box.assets]
-                )
-            )
+    @staticmethod
+    def _address_order(rows):
+        """Newest first; box_id breaks ties between boxes of one transaction."""
+        return (desc(rows.c.inclusion_height), desc(rows.c.tx_index), desc(rows.c.box_id))
 
-        for tx, output in output_txs:
-            transactions.append(
-                AddressTransaction(
-                    id=tx.id,
-                    timestamp=tx.timestamp,
-                    type="output",
-                    value=output.value,
-                    assets=[asset.__dict__ for asset in output.assets]
-                )
+    async def _address_page_items(self, page: List[Any]) -> List[AddressTransaction]:
+        """Build address transactions for a page of rows, loading assets at once."""
+        assets_by_box: Dict[str, List[AssetBase]] = defaultdict(list)
+        asset_rows = await self.session.execute(
+            select(Asset.box_id, Asset.token_id, Asset.amount, Asset.name, Asset.decimals)
+            .where(Asset.box_id.in_({row.box_id for row in page}))
+        )
+        asset_rows = asset_rows.all()
+        # Rows come straight from typed columns, so build them unvalidated
+        for asset, box_asset in zip(asset_rows, construct_all(AssetBase, asset_rows)):
+            assets_by_box[asset.box_id].append(box_asset)
+        
+        return [
+            AddressTransaction.construct(
+                id=row.id,
+                timestamp=row.timestamp,
+                type=row.type,
+                value=row.value,
+                assets=assets_by_box.get(row.box_id, [])
             )
+            for row in page
+        ]
 
-        # Sort by timestamp
-        transactions.sort(key=lambda x: x.timestamp, reverse=True)
-        return transactions[:limit]
-
-    async def count_address_transactions(self, address: str) -> int:
-        """Count transactions for address."""
-        # Count inputs
-        input_count = await self.session.execute(
-            select(func.count(Transaction.id))
-            .join(Input, Transaction.id == Input.tx_id)
-            .join(Output, Input.box_id == Output.box_id)
-            .where(Output.address == address)
+    async def get_address_transactions_with_total(
+        self,
+        address: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[AddressTransaction], int, Optional[Tuple[int, int, str]]]:
+        """
+        Get a page of transactions for address together with the total count.
+        
+        Spent and received boxes are merged in one query and the total is
+        computed with a window function over the same scan. Like
+        count_address_transactions, the scan stops past ADDRESS_COUNT_CAP
+        rows (or past the page, for deeper offsets) and a total above the cap
+        is reported as ADDRESS_COUNT_CAP + 1. The key of the last row is
+        returned so callers can continue with keyset pagination.
+        """
+        rows = self._address_rows(address)
+        bounded = (
+            select(rows)
+            .order_by(*self._address_order(rows))
+            .limit(max(ADDRESS_COUNT_CAP, skip + limit) + 1)
+            .subquery()
         )
-
-        # Count outputs
-        output_count = await self.session.execute(
-            select(func.count(Transaction.id))
-            .join(Output, Transaction.id == Output.tx_id)
-            .where(Output.address == address)
+        result = await self.session.execute(
+            select(bounded, func.count().over().label("total"))
+            .order_by(*self._address_order(bounded))
+            .offset(skip)
+            .limit(limit)
         )
+        page = result.all()
+        if not page:
+            # Past the last page the window has no rows to report a total on
+            total = await self.count_address_transactions(address) if skip > 0 else 0
+            return [], total, None
+        
+        # The bound ends past this page, so the window count still tells
+        # whether another page follows
+        counted = page[0].total
+        last = page[-1]
+        next_key = None
+        if skip + len(page) < counted:
+            next_key = (last.inclusion_height, last.tx_index, last.box_id)
+        total = min(counted, ADDRESS_COUNT_CAP + 1)
+        return await self._address_page_items(page), total, next_key
 
-        return (input_count.scalar_one() or 0) + (output_count.scalar_one() or 0)
+    async def get_address_transactions_after(
+        self,
+        address: str,
+        after: Optional[Tuple[int, int, str]] = None,
+        limit: int = 100
+    ) -> Tuple[List[AddressTransaction], Optional[Tuple[int, int, str]]]:
+        """
+        Get a page of transactions for address using keyset pagination.
+        
+        Args:
+            address: Address to look up
+            after: (inclusion_height, tx_index, box_id) of the last row already
+                seen, or None for the first page
+            limit: Page size
         
+        Returns:
+            The page and the key to continue after, None on the last page
+        """
+        rows = self._address_rows(address)
+        query = select(rows).order_by(*self._address_order(rows)).limit(limit + 1)
+        if after is not None:
+            query = query.where(
+                tuple_(rows.c.inclusion_height, rows.c.tx_index, rows.c.box_id) < tuple_(*after)
+            )
+        
+        page = (await self.session.execute(query)).all()
+        if not page:
+            return [], None
+        
+        # The extra row only tells us whether another page exists
+        next_key = None
+        if len(page) > limit:
+            page = page[:limit]
+            last = page[-1]
+            next_key = (last.inclusion_height, last.tx_index, last.box_id)
+        
+        return await self._address_page_items(page), next_key
+
+    async def count_address_transactions(self, address: str) -> int:
+        """
+        Count transactions for address, up to ADDRESS_COUNT_CAP.
+
+        Counts the same rows the address pages are built from. Scanning stops
+        after ADDRESS_COUNT_CAP + 1 rows, so a result above the cap means
+        "more than ADDRESS_COUNT_CAP" rather than an exact figure.
+        """
+        rows = self._address_rows(address)
+        bounded = select(rows.c.box_id).limit(ADDRESS_COUNT_CAP + 1).subquery()
+        result = await self.session.execute(select(func.count()).select_from(bounded))
+        return result.scalar_one() or 0
+
     async def get_total_count(self) -> int:
         """
-        Get the total count of transactions using a direct SQL query for performance.
+        Get the approximate count of transactions from planner statistics.
+        
+        Reads reltuples from pg_class, a single catalog row, instead of
+        scanning the whole table. The figure is refreshed by autovacuum/ANALYZE.
         
         Returns:
-            int: The total count of transactions in the database
+            int: The estimated count of transactions in the database
         """
         try:
-            # Use direct SQL for better performance on large tables
-            result = await self.session.execute(text("SELECT COUNT(*) FROM transactions"))
-            count = result.scalar_one() or 0
-            
-            # Log the count for debugging
-            logger.info(f"Transaction count from direct SQL: {count}")
+            result = await self.session.execute(text(TX_COUNT_ESTIMATE_QUERY))
+            count = result.scalar_one_or_none() or 0
             
-            # If the count is zero but we know there should be transactions,
-            # fall back to the SQLAlchemy query as a verification
-            if count == 0:
-                logger.warning("Direct SQL count returned zero, verifying with SQLAlchemy query")
-                backup_query = select(func.count()).select_from(Transaction)
-                backup_result = await self.session.execute(backup_query)
-                backup_count = backup_result.scalar_one() or 0
-                
-                if backup_count > 0:
-                    logger.warning(f"SQLAlchemy query returned {backup_count} transactions, using this count instead")
-                    return backup_count
+            # Not analyzed yet (reltuples is -1 or 0), count exactly once
+            if count <= 0:
+                logger.warning("No row estimate for transactions, falling back to COUNT(*)")
+                result = await self.session.execute(select(func.count()).select_from(Transaction))
+                count = result.scalar_one() or 0
             
             return count
         except Exception as e:
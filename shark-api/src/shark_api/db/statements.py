@@ -0,0 +1,44 @@
+"""Prebuilt statements for the hottest lookups."""
+import logging
+
+from sqlalchemy import bindparam, lambda_stmt, select
+
+from .database import AsyncSessionLocal
+from .models import Block
+
+logger = logging.getLogger(__name__)
+
+# Built once at import; each execution only binds new parameter values
+LATEST_BLOCK = lambda_stmt(lambda: select(Block).order_by(Block.height.desc()).limit(1))
+BLOCK_BY_HEIGHT = lambda_stmt(lambda: select(Block).where(Block.height == bindparam("height")))
+BLOCK_BY_HASH = lambda_stmt(lambda: select(Block).where(Block.id == bindparam("block_id")))
+BLOCKS_RANGE = lambda_stmt(
+    lambda: select(Block)
+    .where(Block.height >= bindparam("start_height"))
+    .where(Block.height <= bindparam("end_height"))
+    .order_by(Block.height.desc())
+)
+
+# Statements and throwaway parameters used to prime the caches
+WARMUP = (
+    (LATEST_BLOCK, {}),
+    (BLOCK_BY_HEIGHT, {"height": -1}),
+    (BLOCK_BY_HASH, {"block_id": ""}),
+    (BLOCKS_RANGE, {"start_height": -1, "end_height": -1}),
+)
+
+async def warm_statement_cache() -> None:
+    """
+    Execute every prebuilt statement once so the first requests skip compilation.
+
+    Fills SQLAlchemy's compiled cache for the engine and the prepared
+    statement cache of the pooled connection that runs them.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            for statement, params in WARMUP:
+                await session.execute(statement, params)
+            await session.rollback()
+    except Exception as e:
+        # A cold cache only costs the first requests some latency
+        logger.warning(f"Statement cache warmup failed: {str(e)}")
@@ -1,14 +1,37 @@
 """Main application module."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import asyncio
 import logging
 
+import asyncpg
+
 from .api.v1.api import api_router
 from .core.config import settings
 from .core.middleware import add_middleware
-from .core.simple_monitoring import setup_monitoring, metrics_updater
+from .core.node import create_http_session
+from .core.monitoring import setup_monitoring
+from .db.database import asyncpg_pool_options, close_asyncpg_pool, init_asyncpg_pool
 from .db.dependencies import get_db
+from .db.statements import warm_statement_cache
+
+# Connection pool bounds for the metrics collector
+METRICS_POOL_MIN_SIZE = 1
+METRICS_POOL_MAX_SIZE = 2
+
+# Seconds the readiness probe waits on the database
+READY_TIMEOUT = 1.0
+
+def check_unique_routes(app: FastAPI) -> None:
+    """Fail fast if two routes are registered for the same method and path."""
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {route.path}")
+            seen.add(key)
 
 def create_application() -> FastAPI:
     """Create FastAPI application."""
@@ -22,7 +45,8 @@ def create_application() -> FastAPI:
         version=settings.VERSION,
         docs_url="/api/docs",
         redoc_url="/api/redoc",
-        openapi_url="/api/openapi.json"
+        openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse
     )
     
     # Add CORS middleware
@@ -48,14 +72,45 @@ def create_application() -> FastAPI:
         """Health check endpoint."""
         return {"status": "ok"}
     
-    # Set up metrics updater
+    @app.get("/ready")
+    async def readiness_check():
+        """Readiness check endpoint, a shallow database round trip."""
+        try:
+            await asyncio.wait_for(app.state.pg.execute("SELECT 1"), timeout=READY_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Readiness check failed: {str(e)}")
+            return ORJSONResponse({"status": "unavailable"}, status_code=503)
+        return {"status": "ok"}
+    
+    # Registered last so it runs first: liveness probes never reach rate
+    # limiting, monitoring or the database
+    @app.middleware("http")
+    async def health_short_circuit(request, call_next):
+        if request.url.path == "/health":
+            return ORJSONResponse({"status": "ok"})
+        return await call_next(request)
+    
     @app.on_event("startup")
     async def startup_event():
-        # Schedule the metrics updater task
-        logger.info("Starting metrics updater task...")
-        # Launch the metrics updater with the node URL and network
-        asyncio.create_task(metrics_updater(settings.NODE_URL, settings.NETWORK))
-        logger.info("Metrics updater task scheduled")
+        # One pooled HTTP session keeps connections to the node alive
+        app.state.http = create_http_session()
+        # Small pool for metric queries made at scrape time, kept off the request path
+        app.state.pg = await asyncpg.create_pool(
+            settings.POSTGRES_DSN,
+            min_size=METRICS_POOL_MIN_SIZE,
+            max_size=METRICS_POOL_MAX_SIZE,
+            **asyncpg_pool_options
+        )
+        await init_asyncpg_pool()
+        await warm_statement_cache()
+    
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        await app.state.http.close()
+        await app.state.pg.close()
+        await close_asyncpg_pool()
+    
+    check_unique_routes(app)
     
     return app
 
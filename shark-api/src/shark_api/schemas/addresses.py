@@ -1,7 +1,6 @@
 """Address schemas."""
 from typing import List, Optional
 from pydantic import BaseModel
-from .base import TimestampMixin
 from .transactions import AssetBase
 
 class AddressBalance(BaseModel):
@@ -18,7 +17,7 @@ class AddressStats(BaseModel):
     total_received: int = 0
     total_sent: int = 0
 
-class AddressDetail(TimestampMixin):
+class AddressDetail(BaseModel):
     """Detailed address schema."""
     address: str
     balance: AddressBalance
@@ -1,7 +1,7 @@
 """Asset schemas."""
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
-from .base import TimestampMixin, PaginatedResponse
+from .base import PaginatedResponse
 
 class AssetMetadata(BaseModel):
     """Asset metadata schema."""
@@ -12,7 +12,7 @@ class AssetMetadata(BaseModel):
     issuer_address: Optional[str] = None
     additional_info: Optional[Dict[str, Any]] = None
 
-class AssetDetail(TimestampMixin):
+class AssetDetail(BaseModel):
     """Detailed asset schema."""
     id: str = Field(..., description="Token ID")
     box_id: str = Field(..., description="Box where token was minted")
@@ -33,4 +33,6 @@ class AssetSummary(BaseModel):
 
 class AssetList(PaginatedResponse[AssetSummary]):
     """Asset list response schema."""
-    pass 
\ No newline at end of file
+    # Only counted for offset pages, cursor pages skip the full count
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None 
\ No newline at end of file
@@ -1,9 +1,15 @@
 """Base schemas for API responses."""
-from typing import Generic, TypeVar, Optional, List
+from typing import (
+    Any, Callable, Dict, Generic, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar
+)
+import orjson
 from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, ModelField
 from pydantic.generics import GenericModel
+from pydantic.json import pydantic_encoder
 
 T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
@@ -18,7 +24,97 @@ class PaginatedResponse(GenericModel, Generic[T]):
     page: int
     page_size: int
     
-class TimestampMixin(BaseModel):
-    """Timestamp mixin for responses."""
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None 
\ No newline at end of file
+# (name, nested model, is a list, default factory) for one field
+_FieldPlan = Tuple[str, Optional[type], bool, Optional[Callable[[], Any]]]
+
+# Per model class, the plan for each of its fields
+_construct_plans: Dict[type, Tuple[_FieldPlan, ...]] = {}
+
+def _field_plan(name: str, field: ModelField) -> _FieldPlan:
+    """Work out how _construct fills one field."""
+    nested = field.type_
+    if not (isinstance(nested, type) and issubclass(nested, BaseModel)):
+        nested = None
+    default = None
+    # Non-nullable fields with a default, such as lists, fall back to it
+    if not field.required and not field.allow_none:
+        default = field.get_default
+    return name, nested, field.shape == SHAPE_LIST, default
+
+def _construct_plan(model: type) -> Tuple[_FieldPlan, ...]:
+    """Work out once per model which fields nest models and which need defaults."""
+    plan = _construct_plans.get(model)
+    if plan is None:
+        plan = _construct_plans[model] = tuple(
+            _field_plan(name, field) for name, field in model.__fields__.items()
+        )
+    return plan
+
+def _construct(model: type, source: Any) -> Any:
+    """Build a model and any nested models from a trusted mapping or object."""
+    get = source.get if isinstance(source, Mapping) else lambda name: getattr(source, name, None)
+    values = {}
+    for name, nested, many, default in _construct_plan(model):
+        value = get(name)
+        if value is None:
+            if default is not None:
+                value = default()
+        elif nested is not None:
+            if many:
+                value = [v if isinstance(v, nested) else _construct(nested, v) for v in value]
+            elif not isinstance(value, nested):
+                value = _construct(nested, value)
+        values[name] = value
+    # What BaseModel.construct() ends up doing, minus its per-call field walk
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", set(values))
+    if model.__private_attributes__:
+        instance._init_private_attributes()
+    return instance
+
+def construct_all(model: Type[ModelT], sources: Iterable[Any]) -> List[ModelT]:
+    """
+    Build models from trusted rows without running validators.
+
+    For values typed by the database schema, such as ORM objects, result
+    rows or decoded JSON columns. Each declared field is copied from a
+    mapping key or attribute of the same name, nested models are built the
+    same way.
+    """
+    return [_construct(model, source) for source in sources]
+
+def construct_from(model: Type[ModelT], source: Any) -> ModelT:
+    """Build one model from a trusted row without running validators."""
+    return _construct(model, source)
+
+# Per model class, the fields whose alias differs from the attribute name
+_aliases: Dict[type, Dict[str, str]] = {}
+
+def _model_fields(model: BaseModel) -> Dict[str, Any]:
+    """Get a model's values keyed by alias, without copying nested models."""
+    cls = type(model)
+    aliases = _aliases.get(cls)
+    if aliases is None:
+        aliases = _aliases[cls] = {
+            name: field.alias for name, field in cls.__fields__.items() if field.alias != name
+        }
+    if not aliases:
+        return model.__dict__
+    return {aliases.get(name, name): value for name, value in model.__dict__.items()}
+
+def _encode_default(obj: Any) -> Any:
+    """orjson fallback: nested models become their field dicts, the rest as pydantic does."""
+    if isinstance(obj, BaseModel):
+        return _model_fields(obj)
+    return pydantic_encoder(obj)
+
+def dump_model(model: BaseModel) -> bytes:
+    """
+    Serialize a response model with orjson, using field aliases like FastAPI does.
+
+    Instead of building a full copy with model.dict(), orjson walks the
+    model's own field values and asks _encode_default for nested models.
+    """
+    return orjson.dumps(_model_fields(model), default=_encode_default)
+
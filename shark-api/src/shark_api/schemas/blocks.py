@@ -1,6 +1,7 @@
 """Schemas for block-related data."""
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional
 from pydantic import BaseModel
+from .base import PaginatedResponse, construct_all, construct_from
 
 
 class BlockBase(BaseModel):
@@ -25,7 +26,9 @@ class BlockBase(BaseModel):
     pow_solutions: Optional[Dict]
 
     class Config:
-        from_attributes = True
+        orm_mode = True
+        # Rows are never modified once built
+        allow_mutation = False
 
 
 class BlockHeader(BlockBase):
@@ -33,6 +36,11 @@ class BlockHeader(BlockBase):
     pass
 
 
+class BlockList(PaginatedResponse[BlockHeader]):
+    """Block list response schema."""
+    pass
+
+
 class TransactionBase(BaseModel):
     """Base transaction schema."""
     id: str
@@ -45,7 +53,9 @@ class TransactionBase(BaseModel):
     size: int
 
     class Config:
-        from_attributes = True
+        orm_mode = True
+        # Rows are never modified once built
+        allow_mutation = False
 
 
 class MiningRewardBase(BaseModel):
@@ -56,17 +66,9 @@ class MiningRewardBase(BaseModel):
     miner_address: Optional[str]
 
     class Config:
-        from_attributes = True
-
-
-class BlockDetail(BaseModel):
-    """Block detail schema."""
-    block: BlockBase
-    transactions: List[TransactionBase]
-    mining_rewards: List[MiningRewardBase]
-
-    class Config:
-        from_attributes = True
+        orm_mode = True
+        # Rows are never modified once built
+        allow_mutation = False
 
 
 class BlockDetail(BaseModel):
@@ -77,24 +79,30 @@ class BlockDetail(BaseModel):
     
     @classmethod
     def from_orm(cls, obj):
-        """Create from ORM object."""
-        if isinstance(obj, dict):
-            return cls(**obj)
-        
+        """Create from trusted ORM objects or database rows without validation."""
+        if isinstance(obj, Mapping):
+            parts = obj
         # If the object has all the attributes directly, use it
-        if hasattr(obj, "block") and hasattr(obj, "transactions") and hasattr(obj, "mining_rewards"):
-            return cls(
-                block=obj.block,
-                transactions=obj.transactions,
-                mining_rewards=obj.mining_rewards
-            )
-        
+        elif all(hasattr(obj, name) for name in ("block", "transactions", "mining_rewards")):
+            parts = {
+                "block": obj.block,
+                "transactions": obj.transactions,
+                "mining_rewards": obj.mining_rewards
+            }
         # Otherwise, assume the object is a Block and create the BlockDetail
-        return cls(
-            block=obj,
-            transactions=getattr(obj, "transactions", []),
-            mining_rewards=getattr(obj, "mining_rewards", [])
+        else:
+            parts = {
+                "block": obj,
+                "transactions": getattr(obj, "transactions", []),
+                "mining_rewards": getattr(obj, "mining_rewards", [])
+            }
+
+        # Rows are typed by the database schema, so the validators only cost time
+        return cls.construct(
+            block=construct_from(BlockBase, parts["block"]),
+            transactions=construct_all(TransactionBase, parts.get("transactions", [])),
+            mining_rewards=construct_all(MiningRewardBase, parts.get("mining_rewards", []))
         )
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        orm_mode = True
\ No newline at end of file
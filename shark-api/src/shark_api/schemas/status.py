@@ -24,4 +24,4 @@ class SystemStatus(BaseModel):
     indexer: IndexerStatus
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        orm_mode = True 
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Transaction schemas."""
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
-from .base import TimestampMixin, PaginatedResponse
+from .base import PaginatedResponse
 
 class AssetBase(BaseModel):
     """Base asset schema."""
@@ -10,6 +10,11 @@ class AssetBase(BaseModel):
     name: Optional[str] = None
     decimals: Optional[int] = None
 
+    class Config:
+        """Pydantic config."""
+        orm_mode = True
+        allow_mutation = False
+
 class InputBase(BaseModel):
     """Base input schema."""
     box_id: str
@@ -17,6 +22,12 @@ class InputBase(BaseModel):
     proof_bytes: Optional[str] = None
     extension: Optional[Dict[str, Any]] = None
 
+    class Config:
+        """Pydantic config."""
+        orm_mode = True
+        allow_mutation = False
+        allow_population_by_field_name = True
+
 class OutputBase(BaseModel):
     """Base output schema."""
     box_id: str
@@ -28,6 +39,12 @@ class OutputBase(BaseModel):
     assets: List[AssetBase] = []
     additional_registers: Dict[str, Any] = {}
 
+    class Config:
+        """Pydantic config."""
+        orm_mode = True
+        allow_mutation = False
+        allow_population_by_field_name = True
+
 class TransactionBase(BaseModel):
     """Base transaction schema."""
     id: str
@@ -37,7 +54,7 @@ class TransactionBase(BaseModel):
     size: int
     fee: Optional[int] = None
 
-class TransactionDetail(TransactionBase, TimestampMixin):
+class TransactionDetail(TransactionBase):
     """Detailed transaction schema."""
     inputs: List[InputBase] = []
     outputs: List[OutputBase] = []
@@ -46,6 +63,7 @@ class TransactionDetail(TransactionBase, TimestampMixin):
     
     class Config:
         """Pydantic config."""
+        orm_mode = True
         allow_population_by_field_name = True
 
 class AddressTransaction(BaseModel):
@@ -62,4 +80,8 @@ class TransactionList(PaginatedResponse[TransactionBase]):
 
 class AddressTransactionList(PaginatedResponse[AddressTransaction]):
     """Address transaction list response schema."""
-    pass 
\ No newline at end of file
+    # Only counted for offset pages, cursor pages skip the full scan
+    total: Optional[int] = None
+    # Set when counting stopped at the cap, total then means "at least total"
+    total_capped: bool = False
+    next_cursor: Optional[str] = None 
\ No newline at end of file
@@ -1,16 +1,23 @@
 import asyncio
+import sys
+from pathlib import Path
+
 import pytest
 from typing import AsyncGenerator, Generator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 from shark_api.core.config import settings
-from shark_api.db.session import get_db
+from shark_api.db.dependencies import get_db
+from shark_api.db.models import Base
 from shark_api.main import app
 
+# The token API and shared metrics module live at the shark-api root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
 # Test database URL
-TEST_DATABASE_URL = settings.DATABASE_URL.replace(
-    settings.DATABASE_NAME, f"{settings.DATABASE_NAME}_test"
+TEST_DATABASE_URL = settings.SQLALCHEMY_DATABASE_URI.replace(
+    settings.POSTGRES_DB, f"{settings.POSTGRES_DB}_test"
 )
 
 # Create test engine
@@ -1,7 +1,9 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from shark_api.db.models import Block, Transaction, Output, Asset
+from shark_api.db.models import Block, Transaction, Output, Asset, TokenInfo, AssetMetadata
+from shark_api.db.repositories import transactions as transactions_repo
+from shark_api.api.v1.endpoints import transactions as transactions_endpoint
 
 @pytest.mark.asyncio
 async def test_get_latest_block(client: TestClient, db_session: AsyncSession, test_block_data):
@@ -125,4 +127,87 @@ async def test_get_status(client: TestClient):
     assert response.status_code == 200
     data = response.json()
     assert "height" in data
-    assert "synced" in data 
\ No newline at end of file
+    assert "synced" in data 
+
+@pytest.mark.asyncio
+async def test_search_assets_cursor_pages(client: TestClient, db_session: AsyncSession):
+    """Test following next_cursor through GET /api/v1/assets to the last page."""
+    db_session.add_all([TokenInfo(id=f"aa0{i}", total_supply=1000) for i in range(1, 7)])
+    await db_session.flush()
+    # aa01 and aa03 have no metadata, aa06 has metadata without a name
+    db_session.add_all([
+        AssetMetadata(token_id="aa02", name="Beta"),
+        AssetMetadata(token_id="aa04", name="Alpha"),
+        AssetMetadata(token_id="aa05", name="Alpha"),
+        AssetMetadata(token_id="aa06", name=None),
+    ])
+    await db_session.commit()
+
+    response = client.get("/api/v1/assets?query=aa0&limit=2")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 6
+    seen = [item["id"] for item in data["items"]]
+
+    while data["next_cursor"] is not None:
+        response = client.get(f"/api/v1/assets?query=aa0&limit=2&cursor={data['next_cursor']}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        seen.extend(item["id"] for item in data["items"])
+
+    # Unnamed tokens sort as "" ahead of named ones instead of being skipped
+    assert seen == ["aa01", "aa03", "aa06", "aa04", "aa05", "aa02"]
+
+    # An offset past the last match still reports the same total
+    response = client.get("/api/v1/assets?query=aa0&limit=2&offset=10")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == 6
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path, cursor", [
+    ("/api/v1/assets", "not-base64!"),
+    # "nocolon"
+    ("/api/v1/assets", "bm9jb2xvbg=="),
+    ("/api/v1/transactions/address/test_address", "not-base64!"),
+    ("/api/v1/transactions/address/test_address", "bm9jb2xvbg=="),
+    # "a:b:c", a height and index that are not numbers
+    ("/api/v1/transactions/address/test_address", "YTpiOmM="),
+])
+async def test_malformed_cursor(client: TestClient, path: str, cursor: str):
+    """Test that a malformed cursor is rejected with 400."""
+    response = client.get(f"{path}?cursor={cursor}")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+@pytest.mark.asyncio
+async def test_address_transactions_total_capped(
+    client: TestClient, db_session: AsyncSession, monkeypatch
+):
+    """Test that offset pages cap the total the same way before and past the end."""
+    monkeypatch.setattr(transactions_repo, "ADDRESS_COUNT_CAP", 2)
+    monkeypatch.setattr(transactions_endpoint, "ADDRESS_COUNT_CAP", 2)
+    for i in range(4):
+        db_session.add(Transaction(
+            id=f"capped_tx_{i}", block_id="capped_block", header_id="capped_block",
+            inclusion_height=100 + i, timestamp=1234567890 + i, index=0,
+            main_chain=True, size=256
+        ))
+        db_session.add(Output(
+            box_id=f"capped_box_{i}", tx_id=f"capped_tx_{i}", index_in_tx=0, value=1000,
+            creation_height=100 + i, address="capped_address", ergo_tree="tree"
+        ))
+    await db_session.commit()
+
+    for offset, count in ((0, 1), (10, 0)):
+        response = client.get(
+            f"/api/v1/transactions/address/capped_address?offset={offset}&limit=1"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == count
+        # Four rows, counted only up to the cap of 2 plus one
+        assert data["total"] == 3
+        assert data["total_capped"] is True
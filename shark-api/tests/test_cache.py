@@ -0,0 +1,200 @@
+import asyncio
+from typing import List
+
+import orjson
+import pytest
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from starlette.requests import Request
+
+from shark_api.core import cache
+from shark_api.core.monitoring import registry
+from shark_api.core.ttl import TTLValue
+
+
+class Page(BaseModel):
+    items: List[int]
+
+
+class FakePipeline:
+    """Queues commands and runs them against FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get(self, key):
+        self.ops.append(lambda: self.redis.data.get(key))
+        return self
+
+    def exists(self, key):
+        self.ops.append(lambda: int(key in self.redis.data))
+        return self
+
+    def set(self, key, value, ex=None):
+        self.ops.append(lambda: self.redis.store(key, value))
+        return self
+
+    def delete(self, key):
+        self.ops.append(lambda: int(self.redis.data.pop(key, None) is not None))
+        return self
+
+    async def execute(self):
+        if self.redis.down:
+            raise RedisError("connection refused")
+        return [op() for op in self.ops]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the response caches, without expiry."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def store(self, key, value):
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if self.down:
+            raise RedisError("connection refused")
+        if nx and key in self.data:
+            return None
+        return self.store(key, value)
+
+
+class FakeHeight:
+    async def get(self):
+        return 100
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(cache, "redis_client", redis)
+    monkeypatch.setattr(cache, "indexed_height", FakeHeight())
+    return redis
+
+
+def make_compute(items):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return Page(items=items)
+    return compute, calls
+
+
+def make_request(etag=None):
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def cache_requests(endpoint, result):
+    value = registry.get_sample_value(
+        "list_cache_requests_total", {"endpoint": endpoint, "result": result}
+    )
+    return value or 0
+
+
+@pytest.mark.asyncio
+async def test_cached_json_miss_then_hit(fake_redis):
+    """Test that a miss computes and stores the body, and a hit reuses it."""
+    compute, calls = make_compute([1])
+
+    body = await cache.cached_json("k", 10, compute)
+    assert orjson.loads(body) == {"items": [1]}
+    assert fake_redis.data["k"] == body
+    assert "k:fresh" in fake_redis.data
+
+    assert await cache.cached_json("k", 10, compute) == body
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_json_stale(fake_redis):
+    """Test that a stale value is recomputed by the lock holder only."""
+    fake_redis.data["k"] = b'{"items":[0]}'
+    compute, calls = make_compute([1])
+
+    # Someone else holds the lock, so the stale value is served
+    fake_redis.data["k:lock"] = b"1"
+    assert await cache.cached_json("k", 10, compute) == b'{"items":[0]}'
+    assert calls == []
+
+    # With the lock free this caller recomputes and releases it
+    del fake_redis.data["k:lock"]
+    assert orjson.loads(await cache.cached_json("k", 10, compute)) == {"items": [1]}
+    assert len(calls) == 1
+    assert "k:lock" not in fake_redis.data
+    assert "k:fresh" in fake_redis.data
+
+
+@pytest.mark.asyncio
+async def test_cached_json_redis_error(fake_redis):
+    """Test that the body is computed directly when Redis is unavailable."""
+    fake_redis.down = True
+    compute, calls = make_compute([1])
+
+    assert orjson.loads(await cache.cached_json("k", 10, compute)) == {"items": [1]}
+    assert len(calls) == 1
+    assert fake_redis.data == {}
+
+
+@pytest.mark.asyncio
+async def test_cached_by_height(fake_redis):
+    """Test the hit, miss and not_modified results of cached_by_height."""
+    compute, calls = make_compute([1, 2])
+    params = {"limit": 2, "cursor": None}
+    miss = cache_requests("test.list", "miss")
+    hit = cache_requests("test.list", "hit")
+    not_modified = cache_requests("test.list", "not_modified")
+
+    response = await cache.cached_by_height(make_request(), "test.list", params, compute)
+    assert response.status_code == 200
+    assert orjson.loads(response.body) == {"items": [1, 2]}
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"100-')
+    assert cache_requests("test.list", "miss") == miss + 1
+
+    response = await cache.cached_by_height(make_request(), "test.list", params, compute)
+    assert response.status_code == 200
+    assert response.headers["etag"] == etag
+    assert cache_requests("test.list", "hit") == hit + 1
+
+    response = await cache.cached_by_height(make_request(etag), "test.list", params, compute)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+    assert cache_requests("test.list", "not_modified") == not_modified + 1
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_value_computes_once_per_ttl():
+    """Test that concurrent callers share one computation until the value goes stale."""
+    value = TTLValue(60)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return len(calls)
+
+    assert await asyncio.gather(*(value.get(compute) for _ in range(5))) == [1] * 5
+    assert await value.get(compute) == 1
+
+    value.fetched_at -= 60
+    assert await value.get(compute) == 2
+    assert len(calls) == 2
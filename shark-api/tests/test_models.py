@@ -1,6 +1,9 @@
+import orjson
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 from shark_api.db.models import Block, Transaction, Input, Output, Asset
+from shark_api.schemas.base import construct_from, dump_model
+from shark_api.schemas.transactions import TransactionDetail
 
 @pytest.mark.asyncio
 async def test_block_model(db_session: AsyncSession, test_block_data):
@@ -104,4 +107,49 @@ async def test_asset_model(db_session: AsyncSession, test_asset_data):
     assert asset.token_id == test_asset_data["token_id"]
     assert asset.amount == test_asset_data["amount"]
     assert asset.name == test_asset_data["name"]
-    assert asset.decimals == test_asset_data["decimals"] 
\ No newline at end of file
+    assert asset.decimals == test_asset_data["decimals"] 
+
+def make_orm_transaction(test_transaction_data, test_asset_data, registers=None):
+    """Unsaved ORM transaction with one input and one output holding an asset."""
+    data = {k: v for k, v in test_transaction_data.items() if k not in ("inputs", "outputs")}
+    return Transaction(
+        **data,
+        inclusion_height=1000000,
+        fee=1000,
+        inputs=[Input(box_id="test_input_box", index_in_tx=1, proof_bytes="test_proof")],
+        outputs=[Output(
+            box_id=test_asset_data["box_id"],
+            index_in_tx=2,
+            value=1000000,
+            creation_height=1000000,
+            address="test_address",
+            ergo_tree="test_ergo_tree",
+            additional_registers=registers,
+            assets=[Asset(**test_asset_data)],
+        )],
+    )
+
+def test_construct_transaction_detail(test_transaction_data, test_asset_data):
+    """Constructed details dump aliases and build nested models."""
+    orm_tx = make_orm_transaction(test_transaction_data, test_asset_data)
+    detail = construct_from(TransactionDetail, orm_tx)
+    body = orjson.loads(dump_model(detail))
+
+    assert body["inputs"][0]["index"] == 1
+    assert body["outputs"][0]["index"] == 2
+    assert "index_in_tx" not in body["outputs"][0]
+    assert body["outputs"][0]["additional_registers"] == {}
+    assert body["outputs"][0]["assets"] == [{
+        "token_id": test_asset_data["token_id"],
+        "amount": test_asset_data["amount"],
+        "name": test_asset_data["name"],
+        "decimals": test_asset_data["decimals"],
+    }]
+
+def test_construct_matches_validated(test_transaction_data, test_asset_data):
+    """Constructing skips validation but serializes like the validated model."""
+    orm_tx = make_orm_transaction(test_transaction_data, test_asset_data, {"R4": "0e01"})
+    constructed = orjson.loads(dump_model(construct_from(TransactionDetail, orm_tx)))
+    validated = TransactionDetail.from_orm(orm_tx).dict(by_alias=True)
+
+    assert constructed == validated
@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import asyncpg
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import metrics
+from app.api.database import get_db
+from app.main import app
+
+TOKEN_SQL = Path(__file__).resolve().parents[2] / "db-init" / "06-token-holders.sql"
+
+
+class FakeTokenConnection:
+    """Stands in for TokenConnection, returning canned JSON text."""
+
+    def __init__(self, raw="[]"):
+        self.raw = raw
+        self.error = None
+        self.calls = []
+
+    async def fetch_token_json(self, name, *args):
+        self.calls.append((name, args))
+        if self.error is not None:
+            raise self.error
+        return self.raw
+
+
+@pytest.fixture
+def token_conn():
+    return FakeTokenConnection()
+
+
+@pytest.fixture
+def token_client(token_conn):
+    """Test client for the token app; startup is skipped so no pool is opened."""
+    async def override_get_db():
+        yield token_conn
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_metrics_middleware_installed():
+    """The token app counts and times every request."""
+    assert any(m.cls is metrics.MetricsMiddleware for m in app.user_middleware)
+
+
+def test_request_counted_by_route(token_client):
+    """Requests are counted under their route template."""
+    key = ("GET", "/api/tokens/address/{address}", "200")
+    counter = metrics._request_counts.get(key)
+    before = counter.n if counter is not None else 0
+
+    response = token_client.get("/api/tokens/address/test_address")
+
+    assert response.status_code == 200
+    assert metrics._request_counts[key].n == before + 1
+
+
+@pytest.mark.parametrize("error, detail", [
+    (asyncpg.PostgresError("relation does not exist"), "Database error"),
+    (RuntimeError("unexpected"), "Internal server error"),
+])
+def test_errors_become_500(token_client, token_conn, error, detail):
+    """Failures are reported as 500 without their message outside DEBUG."""
+    token_conn.error = error
+    for path in ("/api/tokens/top?limit=7", "/api/tokens/address/test_address"):
+        response = token_client.get(path)
+        assert response.status_code == 500
+        assert response.json() == {"detail": detail}
+
+
+def test_holders_batch_keeps_request_order(token_client, token_conn):
+    """Lookups reach the stored procedure as arrays in request order."""
+    token_conn.raw = '[{"total": 1}, {"error": "Token not found", "status": 404}]'
+    response = token_client.post("/api/tokens/holders:batch", json={"tokens": [
+        {"token_id": "b", "limit": 5},
+        {"token_id": "a", "offset": 10},
+        {"token_id": "c", "limit": 1, "offset": 2},
+    ]})
+
+    assert response.status_code == 200
+    assert response.content == token_conn.raw.encode()
+    assert token_conn.calls == [
+        ("get_token_holders_batch", (["b", "a", "c"], [5, 20, 1], [0, 10, 2]))
+    ]
+
+
+def test_holders_batch_capped_at_100(token_client, token_conn):
+    """More than 100 lookups are rejected before touching the database."""
+    tokens = [{"token_id": str(i)} for i in range(101)]
+    response = token_client.post("/api/tokens/holders:batch", json={"tokens": tokens})
+
+    assert response.status_code == 422
+    assert token_conn.calls == []
+
+    response = token_client.post("/api/tokens/holders:batch", json={"tokens": tokens[:100]})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_get_token_holders_batch_unwraps_errors(db_session: AsyncSession):
+    """Each result is in request order, with errors unwrapped from "__err__"."""
+    connection = await db_session.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    await driver.execute(TOKEN_SQL.read_text())
+    await driver.execute(
+        "INSERT INTO tokens (token_id, name, decimals) VALUES ('known', 'Known', 0)"
+    )
+    await driver.execute(
+        "INSERT INTO token_balances (token_id, address, balance) VALUES ('known', 'addr', 5)"
+    )
+
+    result = orjson.loads(await driver.fetchval(
+        "SELECT get_token_holders_batch($1, $2, $3)::text",
+        ["missing", "known"], [20, 20], [0, 0]
+    ))
+
+    assert result[0] == {"error": "Token not found", "status": 404}
+    assert result[1]["token"]["tokenId"] == "known"
+    assert result[1]["holders"] == [{"address": "addr", "balance": 5, "percentage": 100}]
+    assert result[1]["total"] == 1
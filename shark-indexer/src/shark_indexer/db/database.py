@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker
 )
+from sqlalchemy import text
 from sqlalchemy.orm import registry
 
 from dotenv import load_dotenv
@@ -90,6 +91,8 @@ async def init_db(max_retries: int = 5, retry_delay: int = 5, reset_db: bool = F
                     logger.warning("Dropping all tables for database reset")
                     await conn.run_sync(Base.metadata.drop_all)
                 
+                # Needed by the trigram indexes behind asset search
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
                 await conn.run_sync(Base.metadata.create_all)
             logger.info("Successfully initialized database")
             return
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column, Integer, String, BigInteger, ForeignKey, 
-    DateTime, Boolean, Numeric, Text, UniqueConstraint
+    DateTime, Boolean, Numeric, Text, UniqueConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import JSONB, JSON
 from sqlalchemy.orm import (
@@ -98,6 +98,17 @@ class Output(Base):
     )
     assets = relationship("Asset", back_populates="output")
 
+    __table_args__ = (
+        # Covering index over each address's unspent boxes, see
+        # db-init/migrations/001-address-utxo-index.sql for existing databases
+        Index(
+            'ix_outputs_utxo',
+            'address',
+            postgresql_where=text('spent_by_tx_id IS NULL'),
+            postgresql_include=['box_id', 'value'],
+        ),
+    )
+
 class Asset(Base):
     __tablename__ = 'assets'
 
@@ -112,6 +123,11 @@ class Asset(Base):
 
     output = relationship("Output", back_populates="assets")
 
+    __table_args__ = (
+        Index('assets_box_id_idx', 'box_id'),
+        Index('assets_token_id_box_id_idx', 'token_id', 'box_id'),
+    )
+
 class TokenInfo(Base):
     """Token information model."""
     __tablename__ = "token_info"
@@ -125,6 +141,16 @@ class TokenInfo(Base):
     last_activity = Column(Integer, nullable=True)
     asset_metadata = relationship("AssetMetadata", back_populates="token", uselist=False)
 
+    __table_args__ = (
+        # Trigram index so asset search's ILIKE '%q%' on the ID avoids a seq scan
+        Index(
+            'ix_token_info_id_trgm',
+            'id',
+            postgresql_using='gin',
+            postgresql_ops={'id': 'gin_trgm_ops'},
+        ),
+    )
+
 class SyncStatus(Base):
     __tablename__ = 'sync_status'
 
@@ -163,6 +189,15 @@ class AssetMetadata(Base):
     additional_info = Column(JSON, nullable=True)
     token = relationship("TokenInfo", back_populates="asset_metadata")
 
+    __table_args__ = (
+        Index(
+            'ix_asset_metadata_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+    )
+
 class AddressStats(Base):
     __tablename__ = 'address_stats'
 